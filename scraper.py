@@ -7,22 +7,35 @@
   D) 各児童館（幸田/西部/西原/花園/託麻/秋津/五福/天明/大江/城南）PDF解析
 
 必要ライブラリ:
-  pip install requests beautifulsoup4 playwright pdfplumber
+  pip install requests beautifulsoup4 lxml playwright pdfplumber
   playwright install chromium
 """
 
+import hashlib
 import io
 import json
 import logging
+import multiprocessing
+import os
 import re
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import itemgetter
 from pathlib import Path
 
 import pdfplumber
+from pdfplumber.utils import chars_to_textmap, crop_to_bbox, extract_words
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml import html as lhtml
 from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +58,95 @@ KODOMOBUNKA_KW = [
     "乳幼児", "保護者同伴", "乳児", "赤ちゃん", "ベビー",
     "0歳", "ハーフバースデー", "ハイハイ", "みつばち",
 ]
+KODOMOBUNKA_RE = re.compile("|".join(map(re.escape, KODOMOBUNKA_KW)))
+
+# ─────────────────────────────────────────
+# HTTP共通: 接続を使い回すセッション（keep-alive + リトライ）
+# ─────────────────────────────────────────
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 Chrome/120 Safari/537.36"
+    ),
+    "Accept-Language": "ja,en;q=0.9",
+}
+
+# PDF並列ダウンロードの同時接続数（SESSION のプールサイズ以下にする）
+PDF_FETCH_WORKERS = 8
+# 児童館PDFを並列解析するプロセス数
+PDF_PARSE_WORKERS = 4
+
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+))
+
+# 条件付きGETのキャッシュ置き場（GitHub Actions では actions/cache で持ち越す）
+HTTP_CACHE_DIR = Path(".cache/http")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """同じディレクトリの一時ファイルに書いてから置き換える（途中で落ちても壊れたファイルを残さない）"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _conditional_get(url: str, timeout: int = 20) -> bytes:
+    """
+    ETag / Last-Modified を使った条件付きGET。
+    前回取得時の検証子を送り、304 が返ればディスク上の本文をそのまま返す。
+    キャッシュが読めない・壊れている場合は通常のGETに戻す（キャッシュの失敗で取得を止めない）。
+    """
+    key       = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.body"
+    meta_path = HTTP_CACHE_DIR / f"{key}.json"
+
+    validators = {}
+    if meta_path.exists() and body_path.exists():
+        try:
+            validators = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"HTTPキャッシュが読めないため通常GET {url}: {e}")
+        if not isinstance(validators, dict):
+            validators = {}
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    resp = SESSION.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and validators:
+        logger.debug(f"304 Not Modified: {url}")
+        try:
+            return body_path.read_bytes()
+        except OSError as e:
+            logger.warning(f"HTTPキャッシュ本文が読めないため通常GET {url}: {e}")
+            resp = SESSION.get(url, timeout=timeout)
+    resp.raise_for_status()
+
+    etag          = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        try:
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            _atomic_write(body_path, resp.content)
+            _atomic_write(meta_path, json.dumps(
+                {"url": url, "etag": etag, "last_modified": last_modified}
+            ).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"HTTPキャッシュ保存失敗 {url}: {e}")
+    return resp.content
 
 # ════════════════════════════════════════════════════════
 # ソースD: 児童館 PDF解析ユーティリティ・スクレイパー
@@ -52,23 +154,92 @@ KODOMOBUNKA_KW = [
 
 # ── 共通ユーティリティ ────────────────────────────────────
 
+_Z2H_TABLE = str.maketrans('０１２３４５６７８９：', '0123456789:')
+
+# PDFセルは同じ文字列（曜日・「自由あそび」・空文字など）が繰り返し現れるためキャッシュする
+@lru_cache(maxsize=4096)
 def _z2h(s: str) -> str:
     """全角数字・コロンを半角に変換"""
     if not s:
         return s
-    return s.translate(str.maketrans('０１２３４５６７８９：', '0123456789:'))
+    return s.translate(_Z2H_TABLE)
+
+_CID_RE = re.compile(r'\(cid:\d+\)')
+_WS_RE  = re.compile(r'[　\s]+')
 
+@lru_cache(maxsize=4096)
 def _normalize(s: str) -> str:
     """制御文字除去・空白正規化"""
     if not s:
         return ''
-    s = re.sub(r'\(cid:\d+\)', '', s)
-    s = _z2h(s)
-    s = re.sub(r'[　\s]+', ' ', s).strip()
-    return s
+    if '(cid:' in s:  # 大半のセルには含まれないので正規表現は必要なときだけ
+        s = _CID_RE.sub('', s)
+    return _WS_RE.sub(' ', s.translate(_Z2H_TABLE)).strip()
+
+def _day_row_groups(table: list, min_days: int = 3):
+    """
+    日付行（数字セルが min_days 個以上の行）ごとに、次の日付行までの内容行をまとめて
+    (日付セル, 内容行リスト) を順に返す。表は1回だけ走査する。
+    """
+    day_cells, content_rows = None, []
+    for row in table:
+        days = _day_cells(row)
+        if len(days) >= min_days:
+            if day_cells is not None:
+                yield day_cells, content_rows
+            day_cells, content_rows = days, []
+        elif day_cells is not None:
+            content_rows.append(row)
+    if day_cells is not None:
+        yield day_cells, content_rows
+
+def _current_ym() -> tuple[int, int]:
+    """年月推定のフォールバック用に現在の (年, 月) を返す（now() は1回だけ呼ぶ）"""
+    now = datetime.now()
+    return now.year, now.month
+
+def _col_lookup(wd_cols, width: int) -> list:
+    """
+    列番号 → (曜日, 開始列, 終了列) の対応表を作る。
+    どのブロックにも属さない列は (None, None, None)。重なる場合は先のブロックを優先。
+    """
+    lookup = [(None, None, None)] * width
+    for blk in reversed(wd_cols):
+        _, s, e = blk
+        for ci in range(max(s, 0), min(e, width)):
+            lookup[ci] = blk
+    return lookup
+
+def _block_text(rows, s: int, e: int) -> str:
+    """rows の s〜e 列のセルを正規化し、重複を除いて（出現順のまま）改行で連結する"""
+    return '\n'.join(dict.fromkeys(
+        n for row in rows for ci in range(s, min(e, len(row)))
+        if (c := row[ci]) and (n := _normalize(c))
+    ))
+
+def _nonblank_lines(s: str) -> list[str]:
+    """各行を前後の空白を除いて返す（空行は除く）。strip は1行につき1回だけ。"""
+    return [l for l in map(str.strip, s.splitlines()) if l]
+
+def _day_cells(row: list) -> list[tuple[int, int]]:
+    """数字のみのセルを (列番号, 日) のリストで返す（全角数字も int() でそのまま変換できる）"""
+    if not any(row):  # pdfplumber が出す空の区切り行（None / '' のみ）
+        return []
+    cells = []
+    for ci, c in enumerate(row):
+        if c:
+            c = c.strip()
+            if c.isdecimal():
+                cells.append((ci, int(c)))
+    return cells
 
 TIME_RE = re.compile(r'(\d{1,2}):(\d{2})[〜～ー](\d{1,2}):(\d{2})')
 
+# 時刻を含む行・括弧や記号で始まる行は説明として扱う
+_DESC_LINE_RE = re.compile(r'^[（(※★【]|\d{1,2}:\d{2}')
+# タイトル抽出時に取り除く括弧書きと時刻
+_TITLE_NOISE_RE = re.compile(r'[（(][^）)]*[）)]|' + TIME_RE.pattern)
+
 def _extract_time(text: str) -> str | None:
     """テキストから "HH:MM〜HH:MM" を抽出。なければ None"""
     m = TIME_RE.search(_z2h(text))
@@ -76,38 +247,140 @@ def _extract_time(text: str) -> str | None:
         return f"{int(m.group(1)):02d}:{m.group(2)}〜{int(m.group(3)):02d}:{m.group(4)}"
     return None
 
+def _keyword_re(keywords):
+    """
+    キーワード群を先読みの1本の正規表現にまとめる。
+    全位置での一致を1回の走査で列挙できる（重なり合う一致も拾う）。
+    同じ位置では先に並んだキーワードが優先される。
+    """
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+
+def _first_keyword(pattern, rank, t):
+    """t に含まれるキーワードのうち rank が最小（辞書で先頭寄り）のものを返す"""
+    return min((m.group(1) for m in pattern.finditer(t)), key=rank.__getitem__, default=None)
+
+# 上から順に判定し、最初に一致したカテゴリを採用する
+_HALL_CATEGORY_RULES = (
+    (('離乳食', '栄養', '食育'),                                       "食育・栄養"),
+    (('発達', '言語', '相談', '聴覚'),                                  "発達・育児相談"),
+    (('マッサージ', 'アロマ', 'ピラティス', 'エクササイズ', 'ストレッチ'),    "産前・産後"),
+    (('ダンス', '体操', 'リトミック', '体を動', 'サーキット', '運動', '体力'), "親子ふれあい"),
+    (('おはなし', '読み聞かせ', '工作', '製作', 'おもちゃ', 'あそび', '遊び', 'ふれあい'), "親子ふれあい"),
+    (('身体測定', 'すくすく', 'ハイハイ', '赤ちゃん', '0歳'),              "健康・医療"),
+    (('パパ', '父', 'ひとり親'),                                        "父親・家族支援"),
+)
+# キーワード → カテゴリ（規則の順に並ぶので、rank 最小のキーワードが最優先の規則になる）
+_HALL_CAT_LABEL = {kw: label for kws, label in _HALL_CATEGORY_RULES for kw in kws}
+_HALL_CAT_RE    = _keyword_re(_HALL_CAT_LABEL)
+_HALL_CAT_RANK  = {k: i for i, k in enumerate(_HALL_CAT_LABEL)}
+
+# 同じタイトル（身体測定・おはなし会など）が児童館・月をまたいで繰り返されるためキャッシュする
+@lru_cache(maxsize=1024)
 def _guess_category(text: str) -> str:
-    if re.search(r'離乳食|栄養|食育',                    text): return "食育・栄養"
-    if re.search(r'発達|言語|相談|聴覚',                  text): return "発達・育児相談"
-    if re.search(r'マッサージ|アロマ|ピラティス|エクササイズ|ストレッチ', text): return "産前・産後"
-    if re.search(r'ダンス|体操|リトミック|体を動|サーキット|運動|体力', text): return "親子ふれあい"
-    if re.search(r'おはなし|読み聞かせ|工作|製作|おもちゃ|あそび|遊び|ふれあい', text): return "親子ふれあい"
-    if re.search(r'身体測定|すくすく|ハイハイ|赤ちゃん|0歳',      text): return "健康・医療"
-    if re.search(r'パパ|父|ひとり親',                    text): return "父親・家族支援"
-    return "その他"
+    k = _first_keyword(_HALL_CAT_RE, _HALL_CAT_RANK, text)
+    return _HALL_CAT_LABEL[k] if k else "その他"
 
 # 自由あそび・休館など「イベントでない」コンテンツのパターン
+NON_EVENT_WORDS = ('自由あそび', '休館日', '休館', '開館', '★', '閉館', 'お知らせ', '(cid:')
+
+# 空白と（行をまたがない）括弧書きは無視する。所有的量指定子で「先頭から括弧書きを除去→空白除去」の順序をそのまま表す
+_NON_EVENT_GAP = r'(?:\s|[\(（][^\)）\n]*[\)）])*+'
 NON_EVENT_RE = re.compile(
-    r'^(自由\s*あそび|休館日?|開館|★|閉館|お知らせ|\(cid:)$',
+    _NON_EVENT_GAP
+    + '(?:' + '|'.join(_NON_EVENT_GAP.join(map(re.escape, w)) for w in NON_EVENT_WORDS) + ')?'
+    + _NON_EVENT_GAP,
     re.IGNORECASE
 )
 
 def _is_non_event(text: str) -> bool:
-    """イベントとして登録しない内容かどうか"""
-    t = re.sub(r'[\(（].*?[\)）]', '', text).strip()
-    t = re.sub(r'\s', '', t)
-    return not t or bool(NON_EVENT_RE.match(t))
+    """イベントとして登録しない内容かどうか（空・括弧書きのみも含む）"""
+    return NON_EVENT_RE.fullmatch(text) is not None
 
 def _fetch_pdf_bytes(url: str) -> bytes | None:
     """URLからPDFバイト列を取得"""
     try:
-        resp = requests.get(url, timeout=20)
-        resp.raise_for_status()
-        return resp.content
+        return _conditional_get(url, timeout=20)
     except requests.RequestException as e:
         logger.error(f"PDF取得失敗 {url}: {e}")
         return None
 
+def _fetch_pdfs_parallel(urls: list[str]) -> dict[str, bytes]:
+    """複数PDFをスレッドで並列取得し {URL: PDFバイト列} を返す（失敗分は含まない）"""
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(PDF_FETCH_WORKERS, len(urls))) as ex:
+        results = dict(zip(urls, ex.map(_fetch_pdf_bytes, urls)))
+    return {url: b for url, b in results.items() if b}
+
+PDF_EVENTS_CACHE_DIR = Path(".cache/pdf_events")
+# 児童館パーサー（ソースD）の出力が変わる修正をしたら上げる。
+# キャッシュキーに含めるので、上げると古い解析結果は使われなくなる
+PDF_PARSER_VERSION = 1
+
+def _pdf_cache_path(source: str, pdf_bytes: bytes) -> Path:
+    """
+    PDF内容のハッシュから解析結果キャッシュのパスを返す。
+    年月が読めないPDFは現在月で補うため、キーには現在の年月も含める。
+    """
+    h = hashlib.blake2b(pdf_bytes, digest_size=16)
+    h.update(f"{source}|{PDF_PARSER_VERSION}|{_current_ym()}".encode("utf-8"))
+    return PDF_EVENTS_CACHE_DIR / f"{h.hexdigest()}.json"
+
+def _parse_pdf_cached(source: str, scraper, pdf_bytes: bytes) -> list[dict]:
+    """PDF内容のハッシュをキーに scraper(pdf_bytes) の結果をディスクへキャッシュする。"""
+    cache_path = _pdf_cache_path(source, pdf_bytes)
+
+    if cache_path.exists():
+        try:
+            events = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"{source}: 解析結果キャッシュが読めないため再解析 {e}")
+        else:
+            logger.info(f"{source}: 解析結果キャッシュ使用 {len(events)} 件")
+            return events
+
+    events = scraper(pdf_bytes)
+    try:
+        PDF_EVENTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write(cache_path, json.dumps(events, ensure_ascii=False).encode("utf-8"))
+    except OSError as e:
+        logger.warning(f"{source}: 解析結果キャッシュ保存失敗 {e}")
+    return events
+
+def _read_first_page(pdf_bytes: bytes, columns: tuple[str, ...] = (),
+                     words: bool = False, tables: bool = True) -> dict:
+    """
+    PDFを1回だけ開き、1ページ目のテーブル・テキスト・メタデータ・ページ幅をまとめて取り出す。
+    columns に "left" / "right" を指定すると、ページを左右半分に切った列のテキスト
+    （全角→半角済み）を "left_text" / "right_text" として追加で返す。
+    列テキストは page.crop().extract_text() と同じ結果だが、crop() は罫線・矩形など
+    全オブジェクトを切り抜き直すため、文字だけを切り抜いてテキスト化する。
+    words=True で page.extract_words() 相当の "words" も返す。
+    テーブルを使わないスクレイパーは tables=False で表検出を省く（"tables" は空リスト）。
+    """
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        page  = pdf.pages[0]
+        chars = page.chars  # 単語・列テキストはこの文字リストから作る
+        res = {
+            "tables": page.extract_tables() if tables else [],
+            "text":   page.extract_text() or "",
+            "meta":   pdf.metadata or {},
+            "width":  page.width,
+        }
+        if words:
+            res["words"] = extract_words(chars)
+        mid = page.width / 2
+        for side in columns:
+            x0, x1 = (0, mid) if side == "left" else (mid, page.width)
+            bbox = (x0, 0, x1, page.height)
+            textmap = chars_to_textmap(
+                crop_to_bbox(chars, bbox),
+                layout_bbox=bbox, layout_width=x1 - x0, layout_height=page.height,
+            )
+            res[f"{side}_text"] = _z2h(textmap.as_string or "")
+    return res
+
 
 # ════════════════════════════════════════════════════════
 # 【汎用】月次カレンダー型PDF パーサー
@@ -119,6 +392,7 @@ def _fetch_pdf_bytes(url: str) -> bytes | None:
 # ════════════════════════════════════════════════════════
 
 WEEKDAYS = ['月', '火', '水', '木', '金', '土', '日']
+_WEEKDAY_SET = frozenset(WEEKDAYS)  # ヘッダー行判定の所属チェック用
 
 def _parse_calendar_table(table: list[list], year: int, month: int,
                            source: str, url: str,
@@ -141,7 +415,7 @@ def _parse_calendar_table(table: list[list], year: int, month: int,
     header_row_idx = None
 
     for ri, row in enumerate(table):
-        found = [ci for ci, c in enumerate(row) if c and c.strip() in WEEKDAYS]
+        found = [ci for ci, c in enumerate(row) if c and c.strip() in _WEEKDAY_SET]
         if len(found) >= 5:  # 5曜日以上見つかればヘッダー確定
             header_row_idx = ri
             for ci in found:
@@ -154,21 +428,13 @@ def _parse_calendar_table(table: list[list], year: int, month: int,
         logger.warning(f"{source}: カレンダーヘッダーが見つかりません")
         return []
 
+    col_wd = _col_lookup(wd_cols, len(table[header_row_idx]))
+
     def get_weekday_block(col):
-        for wd, s, e in wd_cols:
-            if s <= col < e:
-                return wd, s, e
-        return None, None, None
+        return col_wd[col] if col < len(col_wd) else (None, None, None)
 
     def get_block_content(content_row, start_col, end_col):
-        parts = []
-        for ci in range(start_col, min(end_col, len(content_row))):
-            c = content_row[ci]
-            if c and c.strip():
-                n = _normalize(c)
-                if n not in parts:
-                    parts.append(n)
-        return '\n'.join(parts) if parts else ''
+        return _block_text((content_row,), start_col, end_col)
 
     events = []
     i = header_row_idx + 1
@@ -177,10 +443,7 @@ def _parse_calendar_table(table: list[list], year: int, month: int,
         row = table[i]
 
         # 日付行の検出: 全角/半角数字のみのセルが4つ以上
-        day_cells = []
-        for ci, c in enumerate(row):
-            if c and re.match(r'^[０-９\d]+$', c.strip()):
-                day_cells.append((ci, int(_z2h(c.strip()))))
+        day_cells = _day_cells(row)
 
         if len(day_cells) >= 4:
             content_row = table[i + 1] if i + 1 < len(table) else []
@@ -195,10 +458,9 @@ def _parse_calendar_table(table: list[list], year: int, month: int,
                     continue
 
                 # タイトルと説明を分離
-                lines = [l.strip() for l in raw.splitlines() if l.strip()]
                 title_parts, desc_parts = [], []
-                for l in lines:
-                    if re.search(r'\d{1,2}:\d{2}', l) or l.startswith(('（', '(', '※', '★', '【')):
+                for l in _nonblank_lines(raw):
+                    if _DESC_LINE_RE.search(l):
                         desc_parts.append(l)
                     else:
                         title_parts.append(l)
@@ -209,10 +471,8 @@ def _parse_calendar_table(table: list[list], year: int, month: int,
                 # 例: "身体測定 （どなたでもどうぞ） 10:30〜11:00"
                 # → 括弧と時刻を除去してタイトルを取り出す
                 if not title:
-                    clean = re.sub(r'[（(][^）)]*[）)]', '', raw)
-                    clean = TIME_RE.sub('', clean).strip()
-                    clean = re.sub(r'[　\s]+', ' ', clean).strip()
-                    title = clean
+                    clean = _TITLE_NOISE_RE.sub('', raw)
+                    title = _WS_RE.sub(' ', clean).strip()
 
                 if _is_non_event(title):
                     continue
@@ -242,25 +502,32 @@ def _parse_calendar_table(table: list[list], year: int, month: int,
     return events
 
 
+_REIWA_YM_RE   = re.compile(r'令和\s*(\d+)\s*年\s*(\d+)\s*月')
+_SEIREKI_YM_RE = re.compile(r'(20\d{2})\s*年\s*(\d{1,2})\s*月')
+_PAREN_YEAR_RE = re.compile(r'[（(](20\d{2})年[）)]')
+_GOU_MONTH_RE  = re.compile(r'(\d+)月号')
+_NENDO_RE      = re.compile(r'令和\s*(\d+)\s*年度')
+_MONTH_RE      = re.compile(r'(\d{1,2})\s*月')
+
 def _get_year_month_from_pdf_text(text: str, fallback_year: int, fallback_month: int):
     """PDFテキストから年月を推定（令和/西暦/括弧入り/年度+月号 対応）"""
     t = _z2h(text)
     # 令和N年M月（年度ではない）
-    m = re.search(r'令和\s*(\d+)\s*年\s*(\d+)\s*月', t)
+    m = _REIWA_YM_RE.search(t)
     if m:
         return int(m.group(1)) + 2018, int(m.group(2))
     # 西暦N年M月（括弧なし）
-    m = re.search(r'(20\d{2})\s*年\s*(\d{1,2})\s*月', t)
+    m = _SEIREKI_YM_RE.search(t)
     if m:
         return int(m.group(1)), int(m.group(2))
     # "令和N年（2026年）〜 M月号" 形式
-    m_year = re.search(r'[（(](20\d{2})年[）)]', t)
-    m_month = re.search(r'(\d+)月号', t)
+    m_year = _PAREN_YEAR_RE.search(t)
+    m_month = _GOU_MONTH_RE.search(t)
     if m_year and m_month:
         return int(m_year.group(1)), int(m_month.group(1))
     # "令和N年度" + テキスト先頭付近の "M月" (天明児童室等)
-    m_nendo = re.search(r'令和\s*(\d+)\s*年度', t)
-    m_tsuki = re.search(r'(\d{1,2})\s*月', t[:150])
+    m_nendo = _NENDO_RE.search(t)
+    m_tsuki = _MONTH_RE.search(t, 0, 150)
     if m_nendo and m_tsuki:
         reiwa = int(m_nendo.group(1))
         mo    = int(m_tsuki.group(1))
@@ -269,6 +536,14 @@ def _get_year_month_from_pdf_text(text: str, fallback_year: int, fallback_month:
     return fallback_year, fallback_month
 
 
+_CD_RE = re.compile(r'D:(\d{4})(\d{2})(\d{2})')
+
+@lru_cache(maxsize=64)
+def _parse_creation_date(raw: str) -> tuple[int, int, int] | None:
+    """PDF作成日 D:20260217140119+09'00' 形式を (年, 月, 日) にする。解釈できなければ None"""
+    m = _CD_RE.search(raw)
+    return (int(m.group(1)), int(m.group(2)), int(m.group(3))) if m else None
+
 def _get_year_month_from_metadata(metadata: dict, text: str,
                                    fallback_year: int, fallback_month: int) -> tuple[int, int]:
     """
@@ -283,19 +558,18 @@ def _get_year_month_from_metadata(metadata: dict, text: str,
     if y:
         return y, mo
 
-    # 作成日をパース: D:20260217140119+09'00'
-    cd_m = re.search(r'D:(\d{4})(\d{2})(\d{2})', metadata.get('CreationDate', ''))
+    cd = _parse_creation_date(metadata.get('CreationDate', ''))
 
     # "N月号" + 作成日から補完
-    m = re.search(r'(\d+)月号', _z2h(text))
-    if m and cd_m:
+    m = _GOU_MONTH_RE.search(_z2h(text))
+    if m and cd:
         month = int(m.group(1))
-        cy, cmo = int(cd_m.group(1)), int(cd_m.group(2))
+        cy, cmo, _ = cd
         return (cy, month) if month >= cmo else (cy + 1, month)
 
     # 作成日の翌月
-    if cd_m:
-        y2, mo2 = int(cd_m.group(1)), int(cd_m.group(2))
+    if cd:
+        y2, mo2, _ = cd
         mo2 += 1
         if mo2 > 12:
             mo2, y2 = 1, y2 + 1
@@ -308,48 +582,78 @@ def _get_year_month_from_metadata(metadata: dict, text: str,
 # 施設別スクレイパー
 # ════════════════════════════════════════════════════════
 
-# ── 幸田児童館 ────────────────────────────────────────────
+# ── 幸田・西部児童館（月次カレンダー型） ────────────────────
 KODA_URL      = "https://www.city.kumamoto.jp/kiji0031630/index.html"
 KODA_SOURCE   = "幸田児童館"
+SEIBU_URL     = "https://www.city.kumamoto.jp/kiji0031631/index.html"
+SEIBU_SOURCE  = "西部児童館"
+
+# 施設ごとの差分だけを持つ設定
+#   min_tables:   これ未満ならテーブル不足として中止
+#   year_month:   "text" = 本文の年月表記 / "metadata" = タイトル画像のため作成日から推定
+#   title_prefix: タイトル先頭から除去する記号
+CALENDAR_FACILITIES = {
+    "koda": {
+        "source":       KODA_SOURCE,
+        "url":          KODA_URL,
+        "default_time": "10:30〜11:00",
+        "min_tables":   3,
+        "year_month":   "text",
+        "title_prefix": "",
+    },
+    "seibu": {
+        "source":       SEIBU_SOURCE,
+        "url":          SEIBU_URL,
+        "default_time": "11:00〜",
+        "min_tables":   1,
+        "year_month":   "metadata",
+        "title_prefix": "★",
+    },
+}
 
-def scrape_koda(pdf_bytes: bytes) -> list[dict]:
-    """
-    幸田児童館の乳幼児向けPDFを解析してイベントを返す。
-
-    PDF構造:
-        TABLE[0]: 年月ヘッダー
-        TABLE[1]: 朝の活動説明
-        TABLE[2]: 月〜日カレンダー  ← メイン
-        TABLE[3]: 申込制活動詳細
-    """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page   = pdf.pages[0]
-        tables = page.extract_tables()
-        text   = page.extract_text() or ""
+def _scrape_calendar_facility(pdf_bytes: bytes, cfg: dict) -> list[dict]:
+    """月次カレンダー型PDF（最大テーブルがカレンダー本体）を cfg に従って解析する"""
+    source = cfg["source"]
+    pg = _read_first_page(pdf_bytes)
+    tables, text = pg["tables"], pg["text"]
 
-    if not tables or len(tables) < 3:
-        logger.warning(f"{KODA_SOURCE}: テーブルが不足しています")
+    if not tables or len(tables) < cfg["min_tables"]:
+        logger.warning(f"{source}: テーブルが不足しています")
         return []
 
-    year, month = _get_year_month_from_pdf_text(text, datetime.now().year, datetime.now().month)
-    logger.info(f"{KODA_SOURCE}: {year}年{month}月 解析開始")
+    if cfg["year_month"] == "metadata":
+        year, month = _get_year_month_from_metadata(pg["meta"], text, *_current_ym())
+    else:
+        year, month = _get_year_month_from_pdf_text(text, *_current_ym())
+    logger.info(f"{source}: {year}年{month}月 解析開始")
 
-    # TABLE[2] がカレンダー本体（最大の表）
+    # 最大テーブルがカレンダー本体（月始まり・日始まりとも汎用パーサーで対応）
     cal_table = max(tables, key=lambda t: len(t) * len(t[0]) if t else 0)
     events = _parse_calendar_table(
         cal_table, year, month,
-        source=KODA_SOURCE,
-        url=KODA_URL,
-        default_time="10:30〜11:00",
+        source=source,
+        url=cfg["url"],
+        default_time=cfg["default_time"],
     )
 
-    logger.info(f"{KODA_SOURCE}: {len(events)} 件取得")
+    if cfg["title_prefix"]:
+        for e in events:
+            e["title"] = e["title"].lstrip(cfg["title_prefix"]).strip()
+
+    logger.info(f"{source}: {len(events)} 件取得")
     return events
 
+def scrape_koda(pdf_bytes: bytes) -> list[dict]:
+    """
+    幸田児童館の乳幼児向けPDFを解析してイベントを返す。
 
-# ── 西部児童館 ────────────────────────────────────────────
-SEIBU_URL    = "https://www.city.kumamoto.jp/kiji0031631/index.html"
-SEIBU_SOURCE = "西部児童館"
+    PDF構造:
+        TABLE[0]: 年月ヘッダー
+        TABLE[1]: 朝の活動説明
+        TABLE[2]: 月〜日カレンダー  ← メイン
+        TABLE[3]: 申込制活動詳細
+    """
+    return _scrape_calendar_facility(pdf_bytes, CALENDAR_FACILITIES["koda"])
 
 def scrape_seibu(pdf_bytes: bytes) -> list[dict]:
     """
@@ -362,44 +666,17 @@ def scrape_seibu(pdf_bytes: bytes) -> list[dict]:
       - 日付行と内容行が1行ずつ交互（幸田と同じ）
       - イベントに「★」プレフィックスあり → 除去
     """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page     = pdf.pages[0]
-        tables   = page.extract_tables()
-        text     = page.extract_text() or ""
-        metadata = pdf.metadata or {}
-
-    if not tables:
-        logger.warning(f"{SEIBU_SOURCE}: テーブルが見つかりません")
-        return []
-
-    year, month = _get_year_month_from_metadata(
-        metadata, text, datetime.now().year, datetime.now().month
-    )
-    logger.info(f"{SEIBU_SOURCE}: {year}年{month}月 解析開始")
-
-    # 最大テーブルがカレンダー本体
-    cal_table = max(tables, key=lambda t: len(t) * len(t[0]) if t else 0)
-
-    # 汎用パーサーで処理（日曜始まりにも対応済み）
-    events = _parse_calendar_table(
-        cal_table, year, month,
-        source=SEIBU_SOURCE,
-        url=SEIBU_URL,
-        default_time="11:00〜",
-    )
-
-    # タイトルの「★」プレフィックスを除去
-    for e in events:
-        e["title"] = e["title"].lstrip("★").strip()
-
-    logger.info(f"{SEIBU_SOURCE}: {len(events)} 件取得")
-    return events
+    return _scrape_calendar_facility(pdf_bytes, CALENDAR_FACILITIES["seibu"])
 
 
 # ── 西原公園児童館 ─────────────────────────────────────────
 NISHIHARA_URL    = "https://www.city.kumamoto.jp/kiji00322778/index.html"
 NISHIHARA_SOURCE = "西原公園児童館"
 
+_TIME_PAIR_RE          = re.compile(r'(\d{1,2}:\d{2})[〜～](\d{1,2}:\d{2})')
+_NISHIHARA_DAY_RE      = re.compile(r'^(\d+)日?$')
+_NISHIHARA_DAY_TAIL_RE = re.compile(r'日.*')
+
 def scrape_nishihara(pdf_bytes: bytes) -> list[dict]:
     """
     西原公園児童館のPDFを解析してイベントを返す。
@@ -410,11 +687,8 @@ def scrape_nishihara(pdf_bytes: bytes) -> list[dict]:
         TABLE[1]: 朝の活動日程（日付・内容の2列）← メイン
         テキスト: 時刻・対象者情報
     """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page     = pdf.pages[0]
-        tables   = page.extract_tables()
-        text     = page.extract_text() or ""
-        metadata = pdf.metadata or {}
+    pg = _read_first_page(pdf_bytes)
+    tables, text, metadata = pg["tables"], pg["text"], pg["meta"]
 
     if not tables or len(tables) < 2:
         logger.warning(f"{NISHIHARA_SOURCE}: テーブルが不足しています")
@@ -423,7 +697,7 @@ def scrape_nishihara(pdf_bytes: bytes) -> list[dict]:
     year, month = _get_year_month_from_pdf_text(text, 0, 0)
     if not year:
         year, month = _get_year_month_from_metadata(
-            metadata, text, datetime.now().year, datetime.now().month
+            metadata, text, *_current_ym()
         )
     logger.info(f"{NISHIHARA_SOURCE}: {year}年{month}月 解析開始")
 
@@ -432,7 +706,7 @@ def scrape_nishihara(pdf_bytes: bytes) -> list[dict]:
     朝_pos = text_z.find('朝の活動')
     time_str = "10:00〜11:00"
     if 朝_pos >= 0:
-        tm = re.search(r'(\d{1,2}:\d{2})[〜～](\d{1,2}:\d{2})', text_z[朝_pos:])
+        tm = _TIME_PAIR_RE.search(text_z, 朝_pos)
         if tm:
             time_str = f"{tm.group(1)}〜{tm.group(2)}"
 
@@ -454,7 +728,7 @@ def scrape_nishihara(pdf_bytes: bytes) -> list[dict]:
             continue
 
         # 日にち抽出: "18日" "1８日" → 18
-        day_m = re.match(r'^(\d+)日?$', re.sub(r'日.*', '', day_raw).strip())
+        day_m = _NISHIHARA_DAY_RE.match(_NISHIHARA_DAY_TAIL_RE.sub('', day_raw).strip())
         if not day_m:
             continue
         day_num = int(day_m.group(1))
@@ -492,7 +766,7 @@ def _hanazono_build_wd_cols(header_row: list) -> list[tuple]:
     → 各曜日のブロック = (ヘッダー位置-1) 〜 (次の曜日ヘッダー位置-1)
     """
     WEEKDAYS = ['月', '火', '水', '木', '金', '土', '日']
-    wd_header_pos = [ci for ci, c in enumerate(header_row) if c and c.strip() in WEEKDAYS]
+    wd_header_pos = [ci for ci, c in enumerate(header_row) if c and c.strip() in _WEEKDAY_SET]
     wd_data_starts = [ci - 1 for ci in wd_header_pos]
     wd_cols = []
     for i, (wd, start) in enumerate(zip(WEEKDAYS, wd_data_starts)):
@@ -501,18 +775,24 @@ def _hanazono_build_wd_cols(header_row: list) -> list[tuple]:
     return wd_cols
 
 
+_HANAZONO_DESC_LINE_RE   = re.compile(r'^[（(【※]|\d{1,2}:\d{2}')
+_HANAZONO_TITLE_NOISE_RE = re.compile(r'[（(][^）)]*[）)]|\d{1,2}:\d{2}')
+_HANAZONO_TITLE_RE  = re.compile(r'^[「『](.+?)[」』]')
+_MONTH_DAY_RE       = re.compile(r'(\d+)月\s*(\d+)日')
+_HANAZONO_TARGET_RE = re.compile(r'【対象】(.+?)(?=【|$)', re.DOTALL)
+_HANAZONO_SKIP_TITLES = ('天皇誕生日', '建国記念', '開館してます', '祝日')
+
 def _hanazono_parse_back(back_table: list[list], year: int) -> dict[tuple, dict]:
     """
     裏面テーブルをパースして {(month, day): detail_dict} を返す。
     「小学生対象」のみのセルはスキップ。
     """
-    TITLE_RE = re.compile(r'^[「『](.+?)[」』]')
     detail = {}
 
     for row in back_table:
         for cell in row:
             text = _z2h(cell or "")
-            title_m = TITLE_RE.search(text)
+            title_m = _HANAZONO_TITLE_RE.search(text)
             if not title_m:
                 continue
             title = title_m.group(1).strip()
@@ -521,17 +801,17 @@ def _hanazono_parse_back(back_table: list[list], year: int) -> dict[tuple, dict]
             if '小学' in text and '乳幼児' not in text and '0歳' not in text:
                 continue
 
-            date_m = re.search(r'(\d+)月\s*(\d+)日', text)
+            date_m = _MONTH_DAY_RE.search(text)
             if not date_m:
                 continue
             mo, day = int(date_m.group(1)), int(date_m.group(2))
 
             # 時刻: "10:30～11:15" 形式
-            times = re.findall(r'(\d{1,2}:\d{2})[〜～](\d{1,2}:\d{2})', text)
-            time_str = f"{times[0][0]}〜{times[0][1]}" if times else None
+            tm = _TIME_PAIR_RE.search(text)
+            time_str = f"{tm.group(1)}〜{tm.group(2)}" if tm else None
 
             # 対象
-            tgt_m = re.search(r'【対象】(.+?)(?=【|$)', text, re.DOTALL)
+            tgt_m = _HANAZONO_TARGET_RE.search(text)
             target = tgt_m.group(1).strip().replace('\n', ' ') if tgt_m else ""
 
             try:
@@ -560,42 +840,19 @@ def scrape_hanazono(pdf_front: bytes, pdf_back: bytes) -> list[dict]:
       - 休館日・自由あそび・祝日開館案内はスキップ
     """
     # ── 表面 ──────────────────────────────────────────────
-    with pdfplumber.open(io.BytesIO(pdf_front)) as pdf:
-        page   = pdf.pages[0]
-        tables = page.extract_tables()
-        text   = page.extract_text() or ""
-        meta   = pdf.metadata or {}
+    pg = _read_first_page(pdf_front)
+    tables, text, meta = pg["tables"], pg["text"], pg["meta"]
 
-    year, month = _get_year_month_from_metadata(meta, text, datetime.now().year, datetime.now().month)
+    year, month = _get_year_month_from_metadata(meta, text, *_current_ym())
     logger.info(f"{HANAZONO_SOURCE}: {year}年{month}月 解析開始")
 
     cal_table = tables[0]
     wd_cols = _hanazono_build_wd_cols(cal_table[0])
 
-    def get_wd_block(col):
-        for wd, s, e in wd_cols:
-            if s <= col < e:
-                return wd, s, e
-        return None, None, None
+    col_wd = _col_lookup(wd_cols, len(cal_table[0]))
 
-    def get_block(rows, s, e):
-        parts = []
-        for row in rows:
-            for ci in range(s, min(e, len(row))):
-                c = row[ci]
-                if c and c.strip():
-                    n = _normalize(c)
-                    if n and n not in parts:
-                        parts.append(n)
-        return '\n'.join(parts)
-
-    # 日付行を収集
-    day_row_indices = []
-    for ri, row in enumerate(cal_table):
-        day_cells = [(ci, int(_z2h(c.strip()))) for ci, c in enumerate(row)
-                     if c and re.match(r'^[０-９\d]+$', c.strip())]
-        if len(day_cells) >= 3:
-            day_row_indices.append((ri, day_cells))
+    def get_wd_block(col):
+        return col_wd[col] if col < len(col_wd) else (None, None, None)
 
     # ── 裏面 ──────────────────────────────────────────────
     with pdfplumber.open(io.BytesIO(pdf_back)) as pdf:
@@ -604,40 +861,33 @@ def scrape_hanazono(pdf_front: bytes, pdf_back: bytes) -> list[dict]:
     back_detail = _hanazono_parse_back(back_tables[0], year)
 
     # ── カレンダー→イベント化 ──────────────────────────────
-    SKIP_TITLES = re.compile(r'(天皇誕生日|建国記念|開館してます|祝日)')
-
     front_events = []
     seen_days = set()
 
-    for idx, (ri, day_cells) in enumerate(day_row_indices):
-        next_ri = day_row_indices[idx + 1][0] if idx + 1 < len(day_row_indices) else len(cal_table)
-        content_rows = cal_table[ri + 1:next_ri]
-
+    for day_cells, content_rows in _day_row_groups(cal_table):
         for day_ci, day_num in day_cells:
             wd, s, e = get_wd_block(day_ci)
             if wd is None:
                 continue
 
-            raw = get_block(content_rows, s, e)
+            raw = _block_text(content_rows, s, e)
             if not raw or _is_non_event(raw):
                 continue
 
             # タイトル抽出
-            lines = [l.strip() for l in raw.splitlines() if l.strip()]
             title_parts, desc_parts = [], []
-            for l in lines:
-                if re.search(r'\d{1,2}:\d{2}', _z2h(l)) or l.startswith(('（', '(', '【', '※')):
+            for l in _nonblank_lines(raw):
+                if _HANAZONO_DESC_LINE_RE.search(_z2h(l)):
                     desc_parts.append(l)
                 else:
                     title_parts.append(l)
 
             title = ' '.join(title_parts).strip()
             if not title:
-                clean = re.sub(r'[（(][^）)]*[）)]', '', raw)
-                clean = re.sub(r'\d{1,2}:\d{2}', '', _z2h(clean))
-                title = re.sub(r'\s+', ' ', clean).strip()
+                clean = _HANAZONO_TITLE_NOISE_RE.sub('', _z2h(raw))
+                title = _WS_RE.sub(' ', clean).strip()
 
-            if _is_non_event(title) or SKIP_TITLES.search(title):
+            if _is_non_event(title) or any(w in title for w in _HANAZONO_SKIP_TITLES):
                 continue
 
             # 裏面詳細で補完
@@ -677,7 +927,7 @@ def scrape_hanazono(pdf_front: bytes, pdf_back: bytes) -> list[dict]:
             "category":    _guess_category(d["title"] + d["description"]),
         })
 
-    front_events.sort(key=lambda x: x["date"])
+    front_events.sort(key=itemgetter("date"))
     logger.info(f"{HANAZONO_SOURCE}: {len(front_events)} 件取得")
     return front_events
 
@@ -686,6 +936,14 @@ def scrape_hanazono(pdf_front: bytes, pdf_back: bytes) -> list[dict]:
 TAKUMA_URL    = "https://www.city.kumamoto.jp/kiji0031634/index.html"
 TAKUMA_SOURCE = "託麻児童館"
 
+_TAKUMA_TIME_RE       = re.compile(
+    r'(\d{1,2})時\s*(\d{0,2})\s*分?[〜～]\s*(\d{0,2})\s*時?\s*(\d{0,2})\s*分?'
+)
+_TAKUMA_TRAMPOLINE_RE = re.compile(r'①\s*(\d{1,2})時[〜～](\d{1,2})時(\d{2})分')
+_TAKUMA_TARGET_RE     = re.compile(r'[〈《]\s*対\s*象\s*[〉》]\s*(.+?)(?=[〈《]|$)', re.DOTALL)
+# 「休館」は「臨時休館」も含む
+_TAKUMA_SKIP_WORDS    = ('休館', '自由遊び', '製作セットとは', '春分の日', '祝日開館', 'まちづくりセンター')
+
 def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
     """
     託麻児童館のPDFを解析してイベントを返す。
@@ -697,20 +955,14 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
         朝の活動(★印): 10:30〜固定
         詳細イベント: 左列・右列からイベント名ベースで抽出
     """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page     = pdf.pages[0]
-        tables   = page.extract_tables()
-        meta     = pdf.metadata or {}
-        full_text = page.extract_text() or ""
-
-        # 左右に分割してテキスト取得
-        mid = page.width / 2
-        left_text  = _z2h(page.crop((0, 0, mid, page.height)).extract_text() or "")
-        right_text = _z2h(page.crop((mid, 0, page.width, page.height)).extract_text() or "")
+    # 左右に分割したテキストも同じオープンで取得
+    pg = _read_first_page(pdf_bytes, columns=("left", "right"))
+    tables, full_text, meta = pg["tables"], pg["text"], pg["meta"]
+    left_text, right_text = pg["left_text"], pg["right_text"]
 
     year, month = _get_year_month_from_pdf_text(full_text, 0, 0)
     if not year:
-        year, month = _get_year_month_from_metadata(meta, full_text, datetime.now().year, datetime.now().month)
+        year, month = _get_year_month_from_metadata(meta, full_text, *_current_ym())
     logger.info(f"{TAKUMA_SOURCE}: {year}年{month}月 解析開始")
 
     # ── 詳細ブロックをイベント名で抽出 ──────────────────────
@@ -719,20 +971,18 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
         if idx < 0:
             return None
         snippet = text[idx:idx + 300]
-        dm = re.search(r'(\d+)月\s*(\d+)日', snippet)
+        dm = _MONTH_DAY_RE.search(snippet)
         if not dm:
             return None
         mo, day = int(dm.group(1)), int(dm.group(2))
-        tm = re.search(
-            r'(\d{1,2})時\s*(\d{0,2})\s*分?[〜～]\s*(\d{0,2})\s*時?\s*(\d{0,2})\s*分?', snippet
-        )
+        tm = _TAKUMA_TIME_RE.search(snippet)
         if tm:
             h1, m1 = int(tm.group(1)), int(tm.group(2) or 0)
             h2, m2 = int(tm.group(3) or 0), int(tm.group(4) or 0)
             time_str = f"{h1:02d}:{m1:02d}〜{h2:02d}:{m2:02d}" if h2 else f"{h1:02d}:{m1:02d}〜"
         else:
             time_str = "10:30〜"
-        tgt = re.search(r'[〈《]\s*対\s*象\s*[〉》]\s*(.+?)(?=[〈《]|$)', snippet, re.DOTALL)
+        tgt = _TAKUMA_TARGET_RE.search(snippet)
         target = tgt.group(1).strip().replace('\n', ' ')[:50] if tgt else ""
         return {"month": mo, "day": day, "time": time_str, "target": target}
 
@@ -742,14 +992,14 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
         if idx < 0:
             return None
         snippet = text[idx:idx + 300]
-        dm = re.search(r'(\d+)月\s*(\d+)日', snippet)
+        dm = _MONTH_DAY_RE.search(snippet)
         if not dm:
             return None
         mo, day = int(dm.group(1)), int(dm.group(2))
-        tm = re.search(r'①\s*(\d{1,2})時[〜～](\d{1,2})時(\d{2})分', snippet)
+        tm = _TAKUMA_TRAMPOLINE_RE.search(snippet)
         time_str = (f"{int(tm.group(1)):02d}:00〜{int(tm.group(2)):02d}:{tm.group(3)}"
                     if tm else "10:00〜")
-        tgt = re.search(r'[〈《]\s*対\s*象\s*[〉》]\s*(.+?)(?=[〈《]|$)', snippet, re.DOTALL)
+        tgt = _TAKUMA_TARGET_RE.search(snippet)
         target = tgt.group(1).strip().replace('\n', ' ')[:50] if tgt else ""
         return {"month": mo, "day": day, "time": time_str, "target": target}
 
@@ -772,58 +1022,33 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
     )
 
     WEEKDAYS_STR = ['日', '月', '火', '水', '木', '金', '土']
-    wd_pos = [ci for ci, c in enumerate(cal_table[0]) if c and c.strip() in WEEKDAYS_STR]
+    wd_pos = [ci for ci, c in enumerate(cal_table[0]) if c and c.strip() in _WEEKDAY_SET]
     wd_cols = []
     for i, (wd, start) in enumerate(zip(WEEKDAYS_STR, wd_pos)):
         end = wd_pos[i + 1] if i + 1 < len(wd_pos) else len(cal_table[0])
         wd_cols.append((wd, start, end))
 
-    def get_wd(col):
-        for wd, s, e in wd_cols:
-            if s <= col < e:
-                return wd, s, e
-        return None, None, None
-
-    def get_block(rows, s, e):
-        parts = []
-        for row in rows:
-            for ci in range(s, min(e, len(row))):
-                c = row[ci]
-                if c and c.strip():
-                    n = _normalize(c)
-                    if n and n not in parts:
-                        parts.append(n)
-        return '\n'.join(parts)
-
-    SKIP_RE = re.compile(r'(臨時休館|休館|自由遊び|製作セットとは|春分の日|祝日開館|まちづくりセンター)')
+    col_wd = _col_lookup(wd_cols, len(cal_table[0]))
 
-    day_row_idx = []
-    for ri, row in enumerate(cal_table):
-        days = [(ci, int(_z2h(c.strip()))) for ci, c in enumerate(row)
-                if c and re.match(r'^[０-９\d]+$', c.strip())]
-        if len(days) >= 3:
-            day_row_idx.append((ri, days))
+    def get_wd(col):
+        return col_wd[col] if col < len(col_wd) else (None, None, None)
 
     events = []
-    for idx, (ri, day_cells) in enumerate(day_row_idx):
-        next_ri = day_row_idx[idx + 1][0] if idx + 1 < len(day_row_idx) else len(cal_table)
-        content_rows = cal_table[ri + 1:next_ri]
-
+    for day_cells, content_rows in _day_row_groups(cal_table):
         for day_ci, day_num in day_cells:
             wd, s, e = get_wd(day_ci)
             if wd is None:
                 continue
 
-            raw = get_block(content_rows, s, e)
+            raw = _block_text(content_rows, s, e)
             if not raw:
                 continue
 
             # 各行から★・午前予約制活動 除去、スキップ対象を除いた行を収集
-            lines = [l.strip() for l in raw.splitlines() if l.strip()]
             clean_lines = []
-            for l in lines:
+            for l in _nonblank_lines(raw):
                 l2 = l.replace('★', '').replace('午前予約制活動', '').strip()
-                if l2 and not SKIP_RE.search(l2):
+                if l2 and not any(w in l2 for w in _TAKUMA_SKIP_WORDS):
                     clean_lines.append(l2)
 
             if not clean_lines:
@@ -851,7 +1076,7 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
                 "category":    _guess_category(title + target),
             })
 
-    events.sort(key=lambda x: x["date"])
+    events.sort(key=itemgetter("date"))
 
     # ── カレンダーに載っていない詳細イベントも追加 ──────────────
     # （例: 親子バルーンアートは土曜「自由遊び」欄に埋もれて別掲）
@@ -860,13 +1085,14 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
         if mo != month or day in cal_days:
             continue
         # イベント名をテキストから取得（詳細ブロックの直前行）
+        # left_text / right_text は _read_first_page で半角化済み
         title = "詳細イベント"
+        day_re = re.compile(rf'{mo}月\s*{day}日')
         for col_text in (left_text, right_text):
-            dm = re.search(r'(\d+)月\s*(\d+)日', _z2h(col_text))
             # キーワード直前行を探す
             for kw in ("親子バルーンアート", "救急法指導", "親子トランポリン"):
                 idx = col_text.find(kw)
-                if idx >= 0 and re.search(rf'{mo}月\s*{day}日', _z2h(col_text[idx:idx+100])):
+                if idx >= 0 and day_re.search(col_text, idx, idx + 100):
                     title = kw
                     break
         try:
@@ -883,7 +1109,7 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
             "category":    _guess_category(title + d["target"]),
         })
 
-    events.sort(key=lambda x: x["date"])
+    events.sort(key=itemgetter("date"))
     logger.info(f"{TAKUMA_SOURCE}: {len(events)} 件取得")
     return events
 
@@ -892,6 +1118,13 @@ def scrape_takuma(pdf_bytes: bytes) -> list[dict]:
 AKITSU_URL    = "https://www.city.kumamoto.jp/kiji00311960/index.html"
 AKITSU_SOURCE = "秋津児童館"
 
+# 行スキップ語（リテラルの部分一致なので正規表現ではなく in で判定する。「休館」は「休館日」も含む）
+_AKITSU_SKIP_WORDS = ('休館', '自由あそび', '天皇誕生日', '建国記念', '開館します', '下記参照', '事前申込制')
+# 「事前申込制」は単独行ならスキップ、タイトルの一部なら残す
+_AKITSU_SKIP_PREFIX_RE = re.compile(r'^[〜～].+[〜～]$')  # "～事前申込制～" 形式
+_AKITSU_ASA_TIME_RE    = re.compile(r'朝の活動.*?(\d{1,2})\s*時\s*(\d{0,2})\s*分?[〜～]', re.DOTALL)
+_AKITSU_BIRTHDAY_RE    = re.compile(r'(\d{1,2})月\s*(\d{1,2})日.{0,10}(\d{1,2})\s*時\s*(\d{0,2})\s*分')
+
 def scrape_akitsu(pdf_bytes: bytes) -> list[dict]:
     """
     秋津児童館のPDFを解析してイベントを返す。
@@ -907,62 +1140,52 @@ def scrape_akitsu(pdf_bytes: bytes) -> list[dict]:
           '～事前申込制～\n親子ふれあい遊び\n〈下記参照〉' → 行分割後に「下記参照」を除去
         - 20日(合同お誕生会) はROW6-9に分散 → 全内容行を走査して収集
     """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page   = pdf.pages[0]
-        tables = page.extract_tables()
-        text   = page.extract_text() or ""
-        meta   = pdf.metadata or {}
+    pg = _read_first_page(pdf_bytes)
+    tables, text, meta = pg["tables"], pg["text"], pg["meta"]
 
     year, month = _get_year_month_from_pdf_text(text, 0, 0)
     if not year:
-        year, month = _get_year_month_from_metadata(meta, text, datetime.now().year, datetime.now().month)
+        year, month = _get_year_month_from_metadata(meta, text, *_current_ym())
     logger.info(f"{AKITSU_SOURCE}: {year}年{month}月 解析開始")
 
     cal_table = tables[0]
 
     # 曜日ブロック (花園と同じ: ヘッダー位置-1)
     WEEKDAYS_STR = ['日', '月', '火', '水', '木', '金', '土']
-    wd_header_pos = [ci for ci, c in enumerate(cal_table[0]) if c and c.strip() in WEEKDAYS_STR]
+    wd_header_pos = [ci for ci, c in enumerate(cal_table[0]) if c and c.strip() in _WEEKDAY_SET]
     wd_data_starts = [ci - 1 for ci in wd_header_pos]
     wd_cols = []
     for i, (wd, start) in enumerate(zip(WEEKDAYS_STR, wd_data_starts)):
         end = wd_data_starts[i + 1] if i + 1 < len(wd_data_starts) else len(cal_table[0])
         wd_cols.append((wd, start, end))
 
+    col_wd = _col_lookup(wd_cols, len(cal_table[0]))
+
     def get_wd(col):
-        for wd, s, e in wd_cols:
-            if s <= col < e:
-                return wd, s, e
-        return None, None, None
+        return col_wd[col] if col < len(col_wd) else (None, None, None)
 
     def get_cell_lines(rows: list, s: int, e: int) -> list[str]:
         """
         ブロック内の全セルを改行分割して行リストで返す。
         _normalize ではなくセル単位での行分割を行う（混在防止）。
         """
-        lines = []
+        lines, seen = [], set()
         for row in rows:
             for ci in range(s, min(e, len(row))):
                 c = row[ci]
                 if not c or not c.strip():
                     continue
-                for l in c.splitlines():
-                    l = l.strip()
-                    if l and l not in lines:
+                for l in _nonblank_lines(c):
+                    if l not in seen:
+                        seen.add(l)
                         lines.append(l)
         return lines
 
-    SKIP_LINE_RE = re.compile(
-        r'(休館日?|自由あそび|天皇誕生日|建国記念|開館します|下記参照|事前申込制)'
-    )
-    # 「事前申込制」は単独行ならスキップ、タイトルの一部なら残す
-    SKIP_PREFIX_RE = re.compile(r'^[〜～].+[〜～]$')  # "～事前申込制～" 形式
-
     # テキストから詳細情報（朝の活動時刻）を取得
     text_z = _z2h(text)
     # "朝の活動" の時刻
     asa_time = "10:45〜"
-    m = re.search(r'朝の活動.*?(\d{1,2})\s*時\s*(\d{0,2})\s*分?[〜～]', text_z, re.DOTALL)
+    m = _AKITSU_ASA_TIME_RE.search(text_z)
     if m:
         h, mi = int(m.group(1)), int(m.group(2) or 0)
         asa_time = f"{h:02d}:{mi:02d}〜"
@@ -973,8 +1196,7 @@ def scrape_akitsu(pdf_bytes: bytes) -> list[dict]:
         if '朝の活動' in title or '身体測定' in title or 'ひな祭り' in title or 'じゃがいも' in title:
             return asa_time
         if '誕生会' in title:
-            m = re.search(r'(\d{1,2})月\s*(\d{1,2})日.{0,10}(\d{1,2})\s*時\s*(\d{0,2})\s*分',
-                          text_z[text_z.find('誕生会'):text_z.find('誕生会') + 100])
+            m = _AKITSU_BIRTHDAY_RE.search(text_z[text_z.find('誕生会'):text_z.find('誕生会') + 100])
             if m:
                 h, mi = int(m.group(3)), int(m.group(4) or 0)
                 return f"{h:02d}:{mi:02d}〜"
@@ -983,19 +1205,8 @@ def scrape_akitsu(pdf_bytes: bytes) -> list[dict]:
             return "10:00〜"
         return "10:30〜"
 
-    # 日付行を収集
-    day_row_idx = []
-    for ri, row in enumerate(cal_table):
-        days = [(ci, int(_z2h(c.strip()))) for ci, c in enumerate(row)
-                if c and re.match(r'^[０-９\d]+$', c.strip())]
-        if len(days) >= 3:
-            day_row_idx.append((ri, days))
-
     events = []
-    for idx, (ri, day_cells) in enumerate(day_row_idx):
-        next_ri = day_row_idx[idx + 1][0] if idx + 1 < len(day_row_idx) else len(cal_table)
-        content_rows = cal_table[ri + 1:next_ri]
-
+    for day_cells, content_rows in _day_row_groups(cal_table):
         for day_ci, day_num in day_cells:
             wd, s, e = get_wd(day_ci)
             if wd is None:
@@ -1008,7 +1219,7 @@ def scrape_akitsu(pdf_bytes: bytes) -> list[dict]:
             # スキップ行を除去してタイトルを構築
             clean = []
             for l in raw_lines:
-                if SKIP_LINE_RE.search(l) or SKIP_PREFIX_RE.match(l):
+                if any(w in l for w in _AKITSU_SKIP_WORDS) or _AKITSU_SKIP_PREFIX_RE.match(l):
                     continue
                 clean.append(l)
 
@@ -1034,7 +1245,7 @@ def scrape_akitsu(pdf_bytes: bytes) -> list[dict]:
                 "category":    _guess_category(title),
             })
 
-    events.sort(key=lambda x: x["date"])
+    events.sort(key=itemgetter("date"))
     logger.info(f"{AKITSU_SOURCE}: {len(events)} 件取得")
     return events
 
@@ -1058,26 +1269,22 @@ def scrape_gofuku(pdf_bytes: bytes, manual_json_path: str | None = None) -> list
     """
     # 手動JSONが指定されていればそれを返す
     if manual_json_path:
-        import pathlib
-        p = pathlib.Path(manual_json_path)
+        p = Path(manual_json_path)
         if p.exists():
-            import json as _json
-            events = _json.loads(p.read_text(encoding="utf-8"))
+            events = json.loads(p.read_text(encoding="utf-8"))
             logger.info(f"{GOFUKU_SOURCE}: 手動JSON読み込み {len(events)} 件")
             return events
         else:
             logger.warning(f"{GOFUKU_SOURCE}: 手動JSONが見つかりません: {manual_json_path}")
 
     # スキャンPDFからの自動抽出を試みる（ほぼ失敗する）
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page = pdf.pages[0]
-        text = page.extract_text() or ""
-        meta = pdf.metadata or {}
+    pg = _read_first_page(pdf_bytes, tables=False)
+    text, meta = pg["text"], pg["meta"]
 
     year, month = _get_year_month_from_pdf_text(text, 0, 0)
     if not year:
         year, month = _get_year_month_from_metadata(
-            meta, text, datetime.now().year, datetime.now().month
+            meta, text, *_current_ym()
         )
     logger.warning(f"{GOFUKU_SOURCE}: スキャンPDFのため自動抽出不可。0件を返します（手動JSONを用意してください）。")
     return []
@@ -1087,6 +1294,37 @@ def scrape_gofuku(pdf_bytes: bytes, manual_json_path: str | None = None) -> list
 TENMEI_URL    = "https://www.city.kumamoto.jp/kiji00003855/index.html"
 TENMEI_SOURCE = "天明児童室"
 
+# "午前N時M分～午前N時M分" → "HH:MM〜HH:MM"
+_TENMEI_KANJI_TIME_RE = re.compile(
+    r'午前\s*(?P<h1>\d{1,2})\s*時\s*(?P<m1>\d{0,2})\s*分?\s*[〜～]'
+    r'\s*午前\s*(?P<h2>\d{1,2})\s*時\s*(?P<m2>\d{0,2})\s*分?'
+)
+# 右列の詳細を探すキーワード（後ろのものほど同じ日の詳細を上書きする）
+_TENMEI_DETAIL_KEYWORDS = ("まめまき", "親子でふれあい体操")
+_TENMEI_DETAIL_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _TENMEI_DETAIL_KEYWORDS)) + '))'
+)
+_TENMEI_TARGET_RE = re.compile(r'【対\s*象】\s*(.+?)(?=【|$)', re.DOTALL)
+# skip: セルごと除外する語 / clean: タイトルから取り除く記号・申込区分・時刻
+_TENMEI_TOKEN_RE  = re.compile(
+    r'(?P<skip>休室日|自由あそび|祝日開室日|マークは朝)'
+    r'|(?P<clean>★|（事前申込）|（当日受付）|\d{1,2}[：:]\d{2}[〜～]?|[１1][０0][：:][３3][０0][〜～]?)'
+)
+
+def _tenmei_title(raw: str) -> str | None:
+    """
+    内容セルを1回走査し、除外語があれば None、なければ clean トークンを除いたタイトルを返す。
+    除外語と clean トークンは共通の文字で始まらないため、逐次の search + sub と同じ結果になる。
+    """
+    parts, pos = [], 0
+    for m in _TENMEI_TOKEN_RE.finditer(raw):
+        if m.lastgroup == "skip":
+            return None
+        parts.append(raw[pos:m.start()])
+        pos = m.end()
+    parts.append(raw[pos:])
+    return ''.join(parts).strip()
+
 def scrape_tenmei(pdf_bytes: bytes) -> list[dict]:
     """
     天明児童室のPDFを解析してイベントを返す。
@@ -1099,57 +1337,48 @@ def scrape_tenmei(pdf_bytes: bytes) -> list[dict]:
 
     時刻: "午前N時M分〜午前N時M分" 形式をパース
     """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page   = pdf.pages[0]
-        tables = page.extract_tables()
-        text   = page.extract_text() or ""
-        meta   = pdf.metadata or {}
-        mid    = page.width / 2
-        right_text = _z2h(page.crop((mid, 0, page.width, page.height)).extract_text() or "")
+    pg = _read_first_page(pdf_bytes, columns=("right",))
+    tables, text, meta = pg["tables"], pg["text"], pg["meta"]
+    right_text = pg["right_text"]
 
     year, month = _get_year_month_from_pdf_text(text, 0, 0)
     if not year:
-        year, month = _get_year_month_from_metadata(meta, text, datetime.now().year, datetime.now().month)
+        year, month = _get_year_month_from_metadata(meta, text, *_current_ym())
     logger.info(f"{TENMEI_SOURCE}: {year}年{month}月 解析開始")
 
     cal = tables[1]  # TABLE[1] が7列カレンダー
 
     # ── 右列テキストから詳細情報を収集 ────────────────────────
-    # "午前N時M分～午前N時M分" → "HH:MM〜HH:MM"
-    KANJI_TIME_RE = re.compile(
-        r'午前\s*(\d{1,2})\s*時\s*(\d{0,2})\s*分?\s*[〜～]\s*午前\s*(\d{1,2})\s*時\s*(\d{0,2})\s*分?'
-    )
-
-    def find_detail(keyword: str) -> dict | None:
-        idx = right_text.find(keyword)
-        if idx < 0:
-            return None
+    def find_detail(idx: int) -> dict | None:
         snippet = right_text[idx:idx + 300]
-        dm = re.search(r'(\d+)月\s*(\d+)日', snippet)
+        dm = _MONTH_DAY_RE.search(snippet)
         if not dm:
             return None
         mo, day = int(dm.group(1)), int(dm.group(2))
-        tm = KANJI_TIME_RE.search(snippet)
+        tm = _TENMEI_KANJI_TIME_RE.search(snippet)
         if tm:
-            h1, m1 = int(tm.group(1)), int(tm.group(2) or 0)
-            h2, m2 = int(tm.group(3)), int(tm.group(4) or 0)
+            h1, m1 = int(tm["h1"]), int(tm["m1"] or 0)
+            h2, m2 = int(tm["h2"]), int(tm["m2"] or 0)
             time_str = f"{h1:02d}:{m1:02d}〜{h2:02d}:{m2:02d}"
         else:
             time_str = "10:30〜"
-        tgt = re.search(r'【対\s*象】\s*(.+?)(?=【|$)', snippet, re.DOTALL)
+        tgt = _TENMEI_TARGET_RE.search(snippet)
         target = tgt.group(1).strip().replace('\n', ' ')[:40] if tgt else ""
         return {"month": mo, "day": day, "time": time_str, "target": target}
 
+    # 各キーワードの最初の出現位置を1回の走査で集める
+    first_idx: dict[str, int] = {}
+    for m in _TENMEI_DETAIL_RE.finditer(right_text):
+        first_idx.setdefault(m.group(1), m.start())
+        if len(first_idx) == len(_TENMEI_DETAIL_KEYWORDS):
+            break
+
     detail_map: dict[int, dict] = {}
-    for kw in ("まめまき", "親子でふれあい体操"):
-        d = find_detail(kw)
-        if d:
+    for kw in _TENMEI_DETAIL_KEYWORDS:
+        if kw in first_idx and (d := find_detail(first_idx[kw])):
             detail_map[d["day"]] = d
 
     # ── カレンダーパース ─────────────────────────────────────
-    SKIP_RE  = re.compile(r'(休室日|自由あそび|祝日開室日|マークは朝)')
-    CLEAN_RE = re.compile(r'(★|（事前申込）|（当日受付）|\d{1,2}[：:]\d{2}[〜～]?|[１1][０0][：:][３3][０0][〜～]?)')
-
     events = []
     i = 1
     while i < len(cal):
@@ -1158,22 +1387,19 @@ def scrape_tenmei(pdf_bytes: bytes) -> list[dict]:
         i += 2
 
         for ci, cell in enumerate(date_row):
-            if not cell or not re.match(r'^[０-９\d]+$', cell.strip()):
+            if not cell:
                 continue
-            day_num = int(_z2h(cell.strip()))
-
-            raw = _normalize(content_row[ci] or "") if ci < len(content_row) else ""
-            if not raw or SKIP_RE.search(raw):
+            day_str = cell.strip()
+            if not day_str.isdecimal():
                 continue
+            day_num = int(day_str)
 
-            lines = [l.strip() for l in raw.splitlines() if l.strip()]
-            clean = [CLEAN_RE.sub('', l).strip() for l in lines if not SKIP_RE.search(l)]
-            clean = [l for l in clean if l]
-            if not clean:
+            # _normalize 済みのセルは改行を含まない1行
+            raw = _normalize(content_row[ci] or "") if ci < len(content_row) else ""
+            title = _tenmei_title(raw) if raw else None
+            if not title:
                 continue
 
-            title = ' '.join(clean)
-
             # 詳細補完
             detail = detail_map.get(day_num)
             time_str  = detail["time"]   if detail else (_extract_time(raw) or "10:30〜")
@@ -1194,7 +1420,7 @@ def scrape_tenmei(pdf_bytes: bytes) -> list[dict]:
                 "category":    _guess_category(title),
             })
 
-    events.sort(key=lambda x: x["date"])
+    events.sort(key=itemgetter("date"))
     logger.info(f"{TENMEI_SOURCE}: {len(events)} 件取得")
     return events
 
@@ -1203,6 +1429,17 @@ def scrape_tenmei(pdf_bytes: bytes) -> list[dict]:
 OOE_URL    = "https://www.city.kumamoto.jp/kiji00065744/index.html"
 OOE_SOURCE = "大江児童室"
 
+_OOE_YM_RE          = re.compile(r'(20\d{2})年.*?(\d{1,2})月')
+# "午前N時半" / "午前N時M分" を1つのパターンで拾う（half が取れたら時半）
+_OOE_AM_TIME_RE     = re.compile(r'午前\s*(?P<h>\d{1,2})\s*時(?:(?P<half>半)|\s*(?P<mi>\d{0,2})\s*分?)')
+_OOE_DATE_MARKER_RE = re.compile(r'^日\s*時\s*(?P<mo>\d+)月\s*(?P<day>\d+)日')
+_OOE_ADULT_RE       = re.compile(r'(どなたでも|Android|スマホ|600円)')
+_OOE_INFANT_RE      = re.compile(r'(乳幼児|0歳|1歳|2歳|赤ちゃん)')
+# タイトル推定用の識別キーワード
+_OOE_HAPPY_RE       = re.compile(r'(熊日童話|大ホール|20組)')
+_OOE_WARABE_RE      = re.compile(r'7組（先着順）')
+_OOE_YOCHIYOCHI_RE  = re.compile(r'(まど|0歳児|各9組)')
+
 def scrape_ooe(pdf_bytes: bytes) -> list[dict]:
     """
     大江公民館・児童室のPDFを解析してイベントを返す。
@@ -1210,7 +1447,7 @@ def scrape_ooe(pdf_bytes: bytes) -> list[dict]:
     PDF構造:
         カレンダー形式ではなく、イベントごとに「日 時/場 所/対 象」形式のブロックが
         2列レイアウトで記載されている。
-        テーブル抽出不可 → page.crop() で左右列に分割してテキスト抽出。
+        テーブル抽出不可 → 単語の x 座標で左右列に分け、y 座標順に行を組み立てる。
 
     対象イベント（児童室からのお知らせ）のみ抽出:
         - わらべ唄とおはなし会（乳幼児向け）
@@ -1220,101 +1457,80 @@ def scrape_ooe(pdf_bytes: bytes) -> list[dict]:
     時刻: "午前N時半" → "HH:30〜" に変換
     年月: "令和8年(2026年)2月" 形式から抽出
     """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page = pdf.pages[0]
-        words = page.extract_words()
-        text = page.extract_text() or ""
-        meta = pdf.metadata or {}
-        mid  = page.width / 2
-        left_text  = _z2h(page.crop((0, 0, mid, page.height)).extract_text() or "")
-        right_text = _z2h(page.crop((mid, 0, page.width, page.height)).extract_text() or "")
+    pg = _read_first_page(pdf_bytes, words=True, tables=False)
+    words, text, meta, width = pg["words"], pg["text"], pg["meta"], pg["width"]
 
     # 年月: "(2026年)2月" 形式を優先
     t_all = _z2h(text)
-    m_yr = re.search(r'(20\d{2})年.*?(\d{1,2})月', t_all)
+    m_yr = _OOE_YM_RE.search(t_all)
     if m_yr:
         year, month = int(m_yr.group(1)), int(m_yr.group(2))
     else:
-        year, month = _get_year_month_from_metadata(meta, text, datetime.now().year, datetime.now().month)
+        year, month = _get_year_month_from_metadata(meta, text, *_current_ym())
     logger.info(f"{OOE_SOURCE}: {year}年{month}月 解析開始")
 
     # ── 時刻パース（時半対応） ──────────────────────────────
     def parse_time(snippet: str) -> str:
-        t = snippet
-        # "午前N時半"
-        m = re.search(r'午前\s*(\d{1,2})\s*時半', t)
-        if m:
-            return f"{int(m.group(1)):02d}:30〜"
-        # "午前N時M分"
-        m = re.search(r'午前\s*(\d{1,2})\s*時\s*(\d{0,2})\s*分?', t)
-        if m:
-            h, mi = int(m.group(1)), int(m.group(2) or 0)
+        # 1回の走査で、"午前N時半" があれば最優先、なければ最初の "午前N時M分"
+        first = None
+        for m in _OOE_AM_TIME_RE.finditer(snippet):
+            if m["half"]:
+                return f"{int(m['h']):02d}:30〜"
+            if first is None:
+                first = m
+        if first:
+            h, mi = int(first["h"]), int(first["mi"] or 0)
             return f"{h:02d}:{mi:02d}〜"
         return "10:00〜"
 
-    def parse_block(snippet: str) -> dict | None:
-        dm = re.search(r'(\d+)月\s*(\d+)日', snippet)
-        if not dm:
-            return None
-        mo, day = int(dm.group(1)), int(dm.group(2))
-        time_str = parse_time(snippet)
-        tgt = re.search(r'対\s*象\s*(.+?)(?=定\s*員|受\s*付|$)', snippet, re.DOTALL)
-        target = tgt.group(1).strip().replace('\n', ' ')[:30] if tgt else "乳幼児と保護者"
-        try:
-            ev_date = date(year, mo, day)
-        except ValueError:
-            return None
-        return {"date": ev_date.strftime("%Y-%m-%d"), "time": time_str, "target": target}
-
     events = []
     seen_dates: set[tuple] = set()
 
-    def make_col_lines(words_list, x_min: float, x_max: float, y_round: int = 8):
-        """x座標でフィルタしてy座標順の行リストを作成"""
-        from collections import defaultdict
-        by_y: dict = defaultdict(list)
+    def make_col_lines(words_list, page_width: float, y_round: int = 8) -> list[list[str]]:
+        """
+        単語を1回の走査で左右の列に振り分け、列ごとにy座標順の行リストを作成。
+        (y, x0, 文字列) を1回ソートして y ごとにまとめる。
+        """
+        mid = page_width * 0.5
+        cols = ([], [])
         for w in words_list:
-            if x_min <= w['x0'] < x_max:
+            x0 = w['x0']
+            if 0 <= x0 < page_width:
                 y = round(w['top'] / y_round) * y_round
-                by_y[y].append((w['x0'], _z2h(w['text'])))
+                cols[x0 >= mid].append((y, x0, _z2h(w['text'])))
         result = []
-        for y in sorted(by_y):
-            line = ' '.join(t for _, t in sorted(by_y[y]))
-            result.append(line)
+        for items in cols:
+            items.sort()
+            result.append([' '.join(t for _, _, t in grp) for _, grp in groupby(items, key=itemgetter(0))])
         return result
 
-    DATE_MARKER = re.compile(r'^日\s*時\s*(\d+)月\s*(\d+)日')
-
-    for col_lines in (
-        make_col_lines(words, 0, page.width * 0.5),
-        make_col_lines(words, page.width * 0.5, page.width),
-    ):
+    for col_lines in make_col_lines(words, width):
         i = 0
         while i < len(col_lines):
-            dm = DATE_MARKER.match(col_lines[i].strip())
+            dm = _OOE_DATE_MARKER_RE.match(col_lines[i].strip())
             if dm:
-                mo, day = int(dm.group(1)), int(dm.group(2))
+                mo, day = int(dm["mo"]), int(dm["day"])
                 if mo in (month, month % 12 + 1) and (mo, day) not in seen_dates:
                     snippet = '\n'.join(col_lines[i:i + 10])
 
                     # 成人向け除外
-                    if re.search(r'(どなたでも|Android|スマホ|600円)', snippet):
+                    if _OOE_ADULT_RE.search(snippet):
                         i += 1
                         continue
                     # 乳幼児対象か確認
-                    if not re.search(r'(乳幼児|0歳|1歳|2歳|赤ちゃん)', snippet):
+                    if not _OOE_INFANT_RE.search(snippet):
                         i += 1
                         continue
 
                     time_str = parse_time(snippet)
 
                     # タイトル推定（識別キーワードで分類・優先順位順）
-                    if re.search(r'(熊日童話|大ホール|20組)', snippet):
+                    if _OOE_HAPPY_RE.search(snippet):
                         title = "はっぴぃたいむ ひなまつりおはなし会"
-                    elif re.search(r'7組（先着順）', snippet):
+                    elif _OOE_WARABE_RE.search(snippet):
                         # わらべ唄は7組・和茶室・受付が必要な申込制
                         title = "わらべ唄とおはなし会"
-                    elif re.search(r'(まど|0歳児|各9組)', snippet):
+                    elif _OOE_YOCHIYOCHI_RE.search(snippet):
                         title = "よちよち★たいむ"
                     else:
                         title = f"大江児童室 活動（{mo}月{day}日）"
@@ -1337,7 +1553,7 @@ def scrape_ooe(pdf_bytes: bytes) -> list[dict]:
                     })
             i += 1
 
-    events.sort(key=lambda x: x["date"])
+    events.sort(key=itemgetter("date"))
     logger.info(f"{OOE_SOURCE}: {len(events)} 件取得")
     return events
 
@@ -1347,16 +1563,32 @@ JONAN_URL    = "https://share.google/ZQwwGHym5zYntsZ0x"  # 児童館だよりペ
 JONAN_SOURCE = "城南児童館"
 
 # 乳幼児向けキーワード（これに合致するもののみ抽出）
-_JONAN_INFANT_RE = re.compile(
-    r'(身体測定|豆まき|はじめの一歩|朝の活動|マザーズヨガ|わくわく|あかちゃん|'
-    r'おはなしかい|季節の制作|ひなまつり|ピラティス|ベビーアロマ|English|'
-    r'育児講座|ふれあいサロン|骨盤体操|こども発達|つくってあそぼ|おゆずりマルシェ)'
+_JONAN_INFANT_WORDS = (
+    '身体測定', '豆まき', 'はじめの一歩', '朝の活動', 'マザーズヨガ', 'わくわく', 'あかちゃん',
+    'おはなしかい', '季節の制作', 'ひなまつり', 'ピラティス', 'ベビーアロマ', 'English',
+    '育児講座', 'ふれあいサロン', '骨盤体操', 'こども発達', 'つくってあそぼ', 'おゆずりマルシェ',
 )
 # 乳幼児向け除外キーワード（小学生専用・成人専用・施設案内）
-_JONAN_SKIP_RE = re.compile(
-    r'(書き方教室|Let\'s Dance|キッズ体操|ボードゲーム|スイーツクッキング|'
-    r'おもちゃ病院|はるまつり|インスタグラム|乳幼児おすすめ|地域子育てクラブピカピカイベント)'
+_JONAN_SKIP_WORDS = (
+    '書き方教室', "Let's Dance", 'キッズ体操', 'ボードゲーム', 'スイーツクッキング',
+    'おもちゃ病院', 'はるまつり', 'インスタグラム', '乳幼児おすすめ', '地域子育てクラブピカピカイベント',
 )
+# 先読みで全位置の一致を1回の走査で列挙する（同じ位置では除外語を優先）
+_JONAN_FILTER_RE = re.compile(
+    '(?=(?P<skip>' + '|'.join(map(re.escape, _JONAN_SKIP_WORDS)) + ')'
+    '|(?P<infant>' + '|'.join(map(re.escape, _JONAN_INFANT_WORDS)) + '))'
+)
+
+def _jonan_is_infant(title: str) -> bool:
+    """除外語を含まず、乳幼児向けキーワードを含むタイトルか"""
+    infant = False
+    for m in _JONAN_FILTER_RE.finditer(title):
+        if m.lastgroup == "skip":
+            return False
+        infant = True
+    return infant
+# 時刻行: "HH:MM〜HH:MM" or "HH:MM〜HH:MM\n（予約先）"
+_JONAN_TIME_RE = re.compile(r'^(\d{1,2}:\d{2})[〜～](\d{1,2}:\d{2})')
 
 
 def scrape_jonan(pdf_bytes: bytes) -> list[dict]:
@@ -1372,15 +1604,12 @@ def scrape_jonan(pdf_bytes: bytes) -> list[dict]:
     年月: "令和8年2月号" → _get_year_month_from_pdf_text で取得
     乳幼児向けのみ抽出（小学生・成人向けは除外）
     """
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        page0  = pdf.pages[0]
-        tables = page0.extract_tables()
-        text0  = page0.extract_text() or ""
-        meta   = pdf.metadata or {}
+    pg = _read_first_page(pdf_bytes)
+    tables, text0, meta = pg["tables"], pg["text"], pg["meta"]
 
     year, month = _get_year_month_from_pdf_text(text0, 0, 0)
     if not year:
-        year, month = _get_year_month_from_metadata(meta, text0, datetime.now().year, datetime.now().month)
+        year, month = _get_year_month_from_metadata(meta, text0, *_current_ym())
     logger.info(f"{JONAN_SOURCE}: {year}年{month}月 解析開始")
 
     cal = tables[0]  # 7列カレンダー
@@ -1396,27 +1625,26 @@ def scrape_jonan(pdf_bytes: bytes) -> list[dict]:
                 continue
 
             cell_z = _z2h(cell.strip())
-            lines  = [l.strip() for l in cell_z.splitlines() if l.strip()]
+            lines  = _nonblank_lines(cell_z)
             if not lines:
                 continue
 
             # 最初の行が日付数字か確認
-            day_m = re.match(r'^(\d+)$', lines[0])
-            if not day_m:
+            # （isdigit は "²" 等も真になり int() で落ちるため isdecimal を使う）
+            if not lines[0].isdecimal():
                 continue
-            day_num       = int(day_m.group(1))
+            day_num       = int(lines[0])
             content_lines = lines[1:]
             if not content_lines:
                 continue
 
             # セル内のイベントを「タイトル行 → 時刻行」単位に分割
             # 時刻行: "HH:MM〜HH:MM" or "HH:MM〜HH:MM\n（予約先）"
-            TIME_RE = re.compile(r'^(\d{1,2}:\d{2})[〜～](\d{1,2}:\d{2})')
             sub_events: list[tuple[str, str]] = []
             cur_title: list[str] = []
 
             for l in content_lines:
-                tm = TIME_RE.match(l)
+                tm = _JONAN_TIME_RE.match(l)
                 if tm:
                     time_str = f"{tm.group(1)}〜{tm.group(2)}"
                     if cur_title:
@@ -1428,11 +1656,8 @@ def scrape_jonan(pdf_bytes: bytes) -> list[dict]:
                 sub_events.append((' '.join(cur_title), "11:00〜"))
 
             for title, time_str in sub_events:
-                # 除外判定
-                if _JONAN_SKIP_RE.search(title):
-                    continue
-                # 乳幼児向けでなければスキップ
-                if not _JONAN_INFANT_RE.search(title):
+                # 除外語を含む・乳幼児向けでないものはスキップ
+                if not _jonan_is_infant(title):
                     continue
 
                 try:
@@ -1450,7 +1675,7 @@ def scrape_jonan(pdf_bytes: bytes) -> list[dict]:
                     "category":    _guess_category(title),
                 })
 
-    events.sort(key=lambda x: x["date"])
+    events.sort(key=itemgetter("date"))
     logger.info(f"{JONAN_SOURCE}: {len(events)} 件取得")
     return events
 # ════════════════════════════════════════════════════════
@@ -1532,6 +1757,14 @@ def scrape_all_halls(pdf_map: dict[str, bytes] | None = None) -> list[dict]:
     all_events = []
     pdf_map = pdf_map or {}
 
+    # pdf_map にない施設のPDFはまとめて並列取得しておく
+    pending = [cfg["pdf_url"] for cfg in HALL_CONFIGS
+               if cfg["source"] not in pdf_map and cfg.get("pdf_url")]
+    for url in pending:
+        logger.info(f"PDF取得中 {url}")
+    fetched = _fetch_pdfs_parallel(pending)
+
+    jobs: list[tuple[str, object, bytes]] = []
     for cfg in HALL_CONFIGS:
         source  = cfg["source"]
         scraper = cfg["scraper"]
@@ -1541,20 +1774,42 @@ def scrape_all_halls(pdf_map: dict[str, bytes] | None = None) -> list[dict]:
         if source in pdf_map:
             pdf_bytes = pdf_map[source]
         elif pdf_url:
-            logger.info(f"{source}: PDF取得中 {pdf_url}")
-            pdf_bytes = _fetch_pdf_bytes(pdf_url)
+            pdf_bytes = fetched.get(pdf_url)
         else:
             logger.debug(f"{source}: PDFが未設定のためスキップ")
             continue
 
         if not pdf_bytes:
             continue
+        jobs.append((source, scraper, pdf_bytes))
+
+    # 解析結果キャッシュのない施設だけを別プロセスで並列解析する
+    # （pdfminer は純Pythonで GIL を握るため、スレッドでは CPU を並列に使えない）。
+    # Playwright の接続やスレッドを抱えたまま fork しないよう spawn で起動する。
+    # 子プロセスはモジュール全体を import し直すため、未解析が1件ならその場で解析する。
+    misses = [job for job in jobs if not _pdf_cache_path(job[0], job[2]).exists()]
+    ex = None
+    futures = {}
+    if len(misses) >= 2:
+        ex = ProcessPoolExecutor(
+            max_workers=min(PDF_PARSE_WORKERS, len(misses)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        futures = {source: ex.submit(_parse_pdf_cached, source, scraper, pdf_bytes)
+                   for source, scraper, pdf_bytes in misses}
 
-        try:
-            events = scraper(pdf_bytes)
-            all_events.extend(events)
-        except Exception as e:
-            logger.error(f"{source}: 解析エラー {e}", exc_info=True)
+    # 結果は HALL_CONFIGS の順に連結する（プールに投げなかった施設はその場で読む・解析する）
+    try:
+        for source, scraper, pdf_bytes in jobs:
+            try:
+                fut = futures.get(source)
+                events = fut.result() if fut else _parse_pdf_cached(source, scraper, pdf_bytes)
+                all_events.extend(events)
+            except Exception as e:
+                logger.error(f"{source}: 解析エラー {e}", exc_info=True)
+    finally:
+        if ex:
+            ex.shutdown()
 
     return all_events
 
@@ -1591,6 +1846,11 @@ def _hall_event_to_common(ev: dict) -> dict:
     }
 
 
+PDF_HREF_RE = re.compile(r"\.pdf", re.I)
+# PDFリンク以外のタグは木に入れない（aタグの子孫はそのまま残るのでテキスト判定も可能）
+PDF_LINK_STRAINER = SoupStrainer("a", href=PDF_HREF_RE)
+
+
 def _fetch_pdf_url_from_page(pw_page, page_url: str, keyword: str = "乳幼児") -> str | None:
     """
     Playwrightで施設ページを開き、乳幼児向けPDFのURLを動的取得する。
@@ -1604,22 +1864,17 @@ def _fetch_pdf_url_from_page(pw_page, page_url: str, keyword: str = "乳幼児")
         print(f"  ⚠️ ページ取得失敗 {page_url}: {e}")
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=PDF_LINK_STRAINER)
+    pdf_links = soup.find_all("a", href=PDF_HREF_RE)
+    if not pdf_links:
+        return None
     # "乳幼児" を含むaタグのhrefからPDFを探す
-    for a in soup.find_all("a", href=re.compile(r"\.pdf", re.I)):
-        text = a.get_text(strip=True)
-        href = a.get("href", "")
-        if keyword in text:
-            if href.startswith("http"):
-                return href
-            return "https://www.city.kumamoto.jp" + href
     # キーワードなしでも最初のPDFを返す（フォールバック）
-    for a in soup.find_all("a", href=re.compile(r"\.pdf", re.I)):
-        href = a.get("href", "")
-        if href.startswith("http"):
-            return href
-        return "https://www.city.kumamoto.jp" + href
-    return None
+    a = next((a for a in pdf_links if keyword in a.get_text(strip=True)), pdf_links[0])
+    href = a.get("href", "")
+    if href.startswith("http"):
+        return href
+    return "https://www.city.kumamoto.jp" + href
 
 
 def scrape_all_halls_adapted(pw_page=None) -> list[dict]:
@@ -1632,25 +1887,32 @@ def scrape_all_halls_adapted(pw_page=None) -> list[dict]:
     pdf_map: dict[str, bytes] = {}
 
     if pw_page:
-        for cfg in HALL_CONFIGS:
-            source   = cfg["source"]
-            page_url = cfg["url"]
-            # 城南児童館はGoogle Drive URLのためスキップ（PDF自動取得不可）
-            if "google" in page_url or "share.google" in page_url:
-                print(f"  {source}: Google Drive URL のため自動取得スキップ")
-                continue
-            print(f"  {source}: PDFリンク取得中...")
-            pdf_url = _fetch_pdf_url_from_page(pw_page, page_url, keyword="乳幼児")
-            if not pdf_url:
-                print(f"  {source}: PDFリンクが見つかりませんでした")
-                continue
-            print(f"  {source}: PDF取得中 {pdf_url}")
-            pdf_bytes = _fetch_pdf_bytes(pdf_url)
-            if pdf_bytes:
-                pdf_map[source] = pdf_bytes
-                print(f"  {source}: ✅ PDF取得成功 ({len(pdf_bytes):,} bytes)")
-            else:
-                print(f"  {source}: ❌ PDF取得失敗")
+        # PDFリンクの特定はPlaywrightの1ページで逐次行うが、見つかったPDFは
+        # すぐにスレッドへ投入し、次の施設ページの描画待ちと並行してダウンロードする
+        with ThreadPoolExecutor(max_workers=PDF_FETCH_WORKERS) as ex:
+            futures = {}
+            for cfg in HALL_CONFIGS:
+                source   = cfg["source"]
+                page_url = cfg["url"]
+                # 城南児童館はGoogle Drive URLのためスキップ（PDF自動取得不可）
+                if "google" in page_url or "share.google" in page_url:
+                    print(f"  {source}: Google Drive URL のため自動取得スキップ")
+                    continue
+                print(f"  {source}: PDFリンク取得中...")
+                pdf_url = _fetch_pdf_url_from_page(pw_page, page_url, keyword="乳幼児")
+                if not pdf_url:
+                    print(f"  {source}: PDFリンクが見つかりませんでした")
+                    continue
+                print(f"  {source}: PDF取得中 {pdf_url}")
+                futures[source] = ex.submit(_fetch_pdf_bytes, pdf_url)
+
+            for source, fut in futures.items():
+                pdf_bytes = fut.result()
+                if pdf_bytes:
+                    pdf_map[source] = pdf_bytes
+                    print(f"  {source}: ✅ PDF取得成功 ({len(pdf_bytes):,} bytes)")
+                else:
+                    print(f"  {source}: ❌ PDF取得失敗")
 
     raw = scrape_all_halls(pdf_map=pdf_map if pdf_map else None)
     adapted = [_hall_event_to_common(e) for e in raw]
@@ -1685,44 +1947,64 @@ AGE_MAP = {
 }
 
 
+_CAT_RE   = _keyword_re(CATEGORY_MAP)
+_CAT_RANK = {k: i for i, k in enumerate(CATEGORY_MAP)}
+_AGE_RE   = _keyword_re(AGE_MAP)
+_AGE_RANK = {k: i for i, k in enumerate(AGE_MAP)}
+
+
+@lru_cache(maxsize=2048)
 def guess_category(t):
-    for k, v in CATEGORY_MAP.items():
-        if k in t:
-            return v
-    return "その他"
+    k = _first_keyword(_CAT_RE, _CAT_RANK, t)
+    return CATEGORY_MAP[k] if k else "その他"
 
 
+@lru_cache(maxsize=2048)
 def guess_age(t):
-    for k, v in AGE_MAP.items():
-        if k in t:
-            return v
-    return "指定なし"
+    k = _first_keyword(_AGE_RE, _AGE_RANK, t)
+    return AGE_MAP[k] if k else "指定なし"
 
 
 # ─────────────────────────────────────────
 # 共通ユーティリティ
 # ─────────────────────────────────────────
+REIWA_DATE_RE  = re.compile(r"令和\s*(\d+)\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日")
+FULL_DATE_RE   = re.compile(r"(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日")
+MONTH_DAY_RE   = re.compile(r"(\d{1,2})\s*月\s*(\d{1,2})\s*日")
+SPACES_RE      = re.compile(r"\s+")
+AMPM_TIME_RE   = re.compile(r"(午前|午後)(\d{1,2})時(?:(\d{1,2})分)?")
+KANJI_TIME_RE  = re.compile(r"(\d{1,2})時(?:(\d{1,2})分)?")
+COLON_TIME_RE  = re.compile(r"(\d{1,2}):(\d{2})")
+TIME_RANGE_RE  = re.compile(r"[〜～]|から|より")
+UNTIL_TAIL_RE  = re.compile(r"まで.*")
+URL_RE         = re.compile(r"https?://")
+
+
 def normalize_date(text, base_year=None, base_month=None):
     """各種日付表記を YYYY-MM-DD に変換"""
     if not text:
         return ""
+    # 現在年はキャッシュのキーに含めるため、ここで確定させてから渡す
+    return _normalize_date(text, base_year or datetime.now().year, base_month)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date(text, year, base_month):
     text = text.strip()
-    now = datetime.now()
-    year = base_year or now.year
 
     # 令和
-    m = re.search(r"令和\s*(\d+)\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日", text)
+    m = REIWA_DATE_RE.search(text)
     if m:
         y = 2018 + int(m.group(1))
         return f"{y}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"
 
     # 西暦フル
-    m = re.search(r"(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日", text)
+    m = FULL_DATE_RE.search(text)
     if m:
         return f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"
 
     # 月日のみ
-    m = re.search(r"(\d{1,2})\s*月\s*(\d{1,2})\s*日", text)
+    m = MONTH_DAY_RE.search(text)
     if m:
         mo, dy = int(m.group(1)), int(m.group(2))
         y = year
@@ -1733,11 +2015,12 @@ def normalize_date(text, base_year=None, base_month=None):
     return ""
 
 
+@lru_cache(maxsize=4096)
 def normalize_time(text):
     """時刻表記を HH:MM〜HH:MM 形式に正規化"""
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text.strip())
+    text = SPACES_RE.sub(" ", text.strip())
 
     def to_24h(ampm, h, m_str):
         h = int(h)
@@ -1754,20 +2037,20 @@ def normalize_time(text):
         if "正午" in s:
             return "12:00"
         s = s.replace("：", ":")
-        m = re.search(r"(午前|午後)(\d{1,2})時(?:(\d{1,2})分)?", s)
+        m = AMPM_TIME_RE.search(s)
         if m:
             return to_24h(m.group(1), m.group(2), m.group(3))
-        m = re.search(r"(\d{1,2})時(?:(\d{1,2})分)?", s)
+        m = KANJI_TIME_RE.search(s)
         if m:
             return f"{int(m.group(1)):02d}:{int(m.group(2) or 0):02d}"
-        m = re.search(r"(\d{1,2}):(\d{2})", s)
+        m = COLON_TIME_RE.search(s)
         if m:
             return f"{int(m.group(1)):02d}:{m.group(2)}"
         return ""
 
-    parts = re.split(r"[〜～]|から|より", text, maxsplit=1)
+    parts = TIME_RANGE_RE.split(text, maxsplit=1)
     start = parse_one(parts[0])
-    end_text = re.sub(r"まで.*", "", parts[1]) if len(parts) > 1 else ""
+    end_text = UNTIL_TAIL_RE.sub("", parts[1]) if len(parts) > 1 else ""
     end = parse_one(end_text)
 
     if start and end:
@@ -1781,7 +2064,7 @@ def is_reservation_required(text):
         return False
     if any(kw in text for kw in ["予約不要", "申込不要", "当日申込可", "当日先着"]):
         return False
-    if re.search(r"https?://", text):
+    if URL_RE.search(text):
         return True
     if any(kw in text for kw in ["事前申込", "要申込", "電話申込", "申込み", "申し込み"]):
         return True
@@ -1807,17 +2090,17 @@ def make_event(title, date_raw, date_iso, time_raw, location, apply_info,
     }
 
 
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.I)
+
+
 def fetch_html(url, timeout=15):
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 Chrome/120 Safari/537.36"
-        ),
-        "Accept-Language": "ja,en;q=0.9",
-    }
     try:
-        r = requests.get(url, headers=headers, timeout=timeout)
-        r.encoding = r.apparent_encoding
+        r = SESSION.get(url, timeout=timeout)
+        # apparent_encoding は本文全体を文字コード推定するため使わない。
+        # ヘッダーに charset がなければ <meta charset> を見て、それもなければ UTF-8。
+        if "charset" not in r.headers.get("Content-Type", "").lower():
+            m = META_CHARSET_RE.search(r.content[:4096])
+            r.encoding = m.group(1).decode("ascii") if m else "utf-8"
         return r.text
     except Exception as e:
         print(f"  fetch失敗: {url} -> {e}")
@@ -1827,6 +2110,20 @@ def fetch_html(url, timeout=15):
 # ─────────────────────────────────────────
 # Playwright共通: JSレンダリング後のHTMLを取得
 # ─────────────────────────────────────────
+# 抽出に使わないリソース（画像・フォント・動画・CSS）はダウンロードしない
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+
+def block_heavy_resources(pw_page):
+    """ページ内の重いリソース取得をネットワーク層で中止する"""
+    pw_page.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+        else route.continue_(),
+    )
+
+
 def fetch_html_playwright(pw_page, url, wait_text=None, timeout=20000, retries=3):
     """Playwrightでページを開きJS描画後のHTMLを返す（リトライあり）"""
     print(f"  GET(PW) {url}")
@@ -1835,15 +2132,16 @@ def fetch_html_playwright(pw_page, url, wait_text=None, timeout=20000, retries=3
             # networkidle は重いサイトでタイムアウトしやすいため
             # domcontentloaded に落として速度優先、その後テキスト待機で補完
             pw_page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            found = False
             if wait_text:
                 try:
-                    pw_page.wait_for_function(
-                        f"document.body.innerText.includes('{wait_text}')",
-                        timeout=timeout,
-                    )
+                    pw_page.wait_for_selector(f"text={wait_text}", state="attached", timeout=timeout)
+                    found = True
                 except Exception:
                     print(f"  ⚠️ 待機テキスト「{wait_text}」が見つかりません（続行）")
-            pw_page.wait_for_timeout(2000)
+            # 待機テキストで描画完了を確認できなかったときだけ固定時間待つ
+            if not found:
+                pw_page.wait_for_timeout(2000)
             return pw_page.content()
         except Exception as e:
             print(f"  ⚠️ 試行{attempt}/{retries} 失敗: {e}")
@@ -1857,33 +2155,45 @@ def fetch_html_playwright(pw_page, url, wait_text=None, timeout=20000, retries=3
 # ─────────────────────────────────────────
 # ソースA: 子育てナビ（Playwright）
 # ─────────────────────────────────────────
+DATE_RE      = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})日")
+KIDATE_RE    = re.compile(r"期日\s*(\d{4}年\d{1,2}月\d{1,2}日)")
+PAGE_HREF_RE = re.compile(r"page\d+\.html")
+# 文字列は Playwright でデコード済みなので <meta charset> は無視させる
+HTML_PARSER_A = lhtml.HTMLParser(encoding="utf-8")
+# コメント等を含まないテキストノードだけを集める
+TEXT_NODES = etree.XPath(".//text()", smart_strings=False)
+
+
+def _joined_text(el, sep=" "):
+    """BeautifulSoup の get_text(sep, strip=True) 相当のテキストを返す"""
+    return sep.join(t for t in (s.strip() for s in TEXT_NODES(el)) if t)
+
+
+@lru_cache(maxsize=2048)
 def to_iso(s):
-    m = re.match(r"(\d{4})年(\d{1,2})月(\d{1,2})日", s)
-    return f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}" if m else ""
+    m = DATE_RE.match(s)
+    return f"{m[1]}-{int(m[2]):02d}-{int(m[3]):02d}" if m else ""
 
 
-def find_kidate(a_tag):
-    parent = a_tag.parent
-    if parent:
-        parent_text = parent.get_text(" ", strip=True)
-        m = re.search(r"期日\s*(\d{4}年\d{1,2}月\d{1,2}日)", parent_text)
+def find_kidate(a_el):
+    parent = a_el.getparent()
+    if parent is not None:
+        m = KIDATE_RE.search(_joined_text(parent))
         if m:
             return m.group(1)
-        nxt = parent.find_next_sibling()
-        for _ in range(3):
-            if nxt is None:
-                break
-            text = nxt.get_text(" ", strip=True)
-            m = re.search(r"期日\s*(\d{4}年\d{1,2}月\d{1,2}日)", text)
+        # 後続の兄弟要素（コメントは除く）を3つまで確認
+        siblings = (el for el in parent.itersiblings() if isinstance(el.tag, str))
+        for nxt in islice(siblings, 3):
+            m = KIDATE_RE.search(_joined_text(nxt))
             if m:
                 return m.group(1)
-            nxt = nxt.find_next_sibling()
     return ""
 
 
 def parse_kosodate_html(html):
-    soup = BeautifulSoup(html, "html.parser")
-    all_a = soup.find_all("a", href=re.compile(r"page\d+\.html"))
+    # DOM を作るだけなので BeautifulSoup を介さず lxml で直接パースする
+    root = lhtml.fromstring(html.encode("utf-8"), parser=HTML_PARSER_A)
+    all_a = [a for a in root.iterfind(".//a[@href]") if PAGE_HREF_RE.search(a.get("href"))]
     print(f"  page*.html aタグ数: {len(all_a)}")
     seen_urls = set()
     events = []
@@ -1891,7 +2201,7 @@ def parse_kosodate_html(html):
         url = a.get("href", "")
         if url.startswith("/"):
             url = BASE_URL_A + url
-        title = a.get_text(strip=True)
+        title = _joined_text(a, "")
         if not title:
             continue
         date_raw = find_kidate(a)
@@ -1916,32 +2226,74 @@ def parse_kosodate_html(html):
     return events
 
 
+# Playwright で描画した一覧ページのキャッシュ（ローカルで繰り返し実行するとき用）。
+# ASP.NET の動的ページで ETag 等が当てにならないため、有効期限（秒）だけで判定する。
+# 新着を隠さないよう既定は無効。使うときは環境変数で秒数を指定する:
+#   PW_HTML_CACHE_TTL=3600 python scraper.py
+# （毎日1回の CI では常に期限切れになるため設定しない）
+PW_HTML_CACHE_DIR = Path(".cache/pw_html")
+PW_HTML_CACHE_TTL = int(os.environ.get("PW_HTML_CACHE_TTL") or 0)
+
+
+def _pw_cache_path(url: str) -> Path:
+    return PW_HTML_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+
+
+def _read_pw_cache(url: str) -> str | None:
+    """キャッシュが有効で期限内のものがあれば描画済みHTMLを返す"""
+    if PW_HTML_CACHE_TTL <= 0:
+        return None
+    path = _pw_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < PW_HTML_CACHE_TTL:
+            return path.read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_pw_cache(url: str, html: str) -> None:
+    if PW_HTML_CACHE_TTL <= 0:
+        return
+    try:
+        PW_HTML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write(_pw_cache_path(url), html.encode("utf-8"))
+    except OSError as e:
+        logger.warning(f"描画HTMLキャッシュ保存失敗 {url}: {e}")
+
+
 def scrape_kosodate_with_page(pw_page):
     """ソースA: Playwrightページを受け取って子育てナビをスクレイプ"""
     print("\n=== ソースA: 子育てナビ ===")
     all_events = []
+    seen_urls: set[str] = set()
     for page_num in range(1, 11):
         url = LIST_URL_A if page_num == 1 else f"{LIST_URL_A}&page={page_num}"
-        print(f"  GET {url}")
-        pw_page.goto(url, wait_until="networkidle", timeout=30000)
-        try:
-            pw_page.wait_for_function(
-                "document.body.innerText.includes('期日')", timeout=15000
-            )
-        except Exception:
-            print("  期日テキスト待機タイムアウト")
-        pw_page.wait_for_timeout(2000)
-        html = pw_page.content()
-        events = parse_kosodate_html(html)
+        html = _read_pw_cache(url)
+        if html is not None:
+            print(f"  キャッシュ使用 {url}")
+            events = parse_kosodate_html(html)
+        else:
+            print(f"  GET {url}")
+            # networkidle（通信が0.5秒止まるまで）は待たず、「期日」の要素が現れた時点で進む
+            pw_page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            try:
+                pw_page.wait_for_selector("text=期日", state="attached", timeout=15000)
+            except Exception:
+                print("  期日テキスト待機タイムアウト")
+            html = pw_page.content()
+            events = parse_kosodate_html(html)
+            # 描画失敗したページを期限まで使い回さないよう、イベントが取れたときだけ保存
+            if events:
+                _write_pw_cache(url, html)
         if not events:
             break
-        existing = {e["url"] for e in all_events}
-        new = [e for e in events if e["url"] not in existing]
+        new = [e for e in events if e["url"] not in seen_urls]
         if not new:
             print(f"  {page_num}ページ目: 重複のみ -> 終了")
             break
+        seen_urls.update(e["url"] for e in new)
         all_events.extend(new)
-        time.sleep(1)
     print(f"  ソースA 合計: {len(all_events)} 件")
     return all_events
 
@@ -1950,15 +2302,19 @@ def scrape_kosodate_with_page(pw_page):
 # ソースB: 総合子育て支援センター（Playwright）
 # JavaScriptで動的レンダリングされるため requests では取得不可
 # ─────────────────────────────────────────
+# 見出しと表（の子孫）だけを木にする。文書順は保たれるので find_next も使える
+SOGO_STRAINER = SoupStrainer(["h2", "h3", "table"])
+
+
 def scrape_sogo_center_with_page(pw_page):
     print("\n=== ソースB: 総合子育て支援センター ===")
     html = fetch_html_playwright(pw_page, URL_B, wait_text="イベント情報")
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=SOGO_STRAINER)
     now = datetime.now()
 
-    # ページ全体のテキストで「イベント情報」が存在するか確認
+    # 見出し・表のテキストで「イベント情報」が存在するか確認
     page_text = soup.get_text()
     if "イベント情報" not in page_text:
         print("  イベント情報セクションが見つかりません")
@@ -1992,6 +2348,9 @@ def scrape_sogo_center_with_page(pw_page):
     ]
     print(f"  イベントh3数: {len(target_h3s)}")
 
+    # タグの文書順の位置（表と次のh3の前後関係を O(1) で比べる）
+    order = {id(t): i for i, t in enumerate(soup.find_all(True))}
+
     events = []
     for h3 in target_h3s:
         title = h3.get_text(strip=True)
@@ -2000,22 +2359,14 @@ def scrape_sogo_center_with_page(pw_page):
         if not table:
             continue
 
-        # tableが次のh3より前にあるか確認
+        # tableが次のh3より後ならスキップ（別のh3の表）
         next_h3 = h3.find_next("h3")
-        if next_h3:
-            # tableがnext_h3より後ならスキップ
-            try:
-                h3_pos = str(soup).find(str(h3))
-                table_pos = str(soup).find(str(table))
-                next_h3_pos = str(soup).find(str(next_h3))
-                if table_pos > next_h3_pos:
-                    continue
-            except Exception:
-                pass
+        if next_h3 and order[id(table)] > order[id(next_h3)]:
+            continue
 
         fields = {}
         for tr in table.find_all("tr"):
-            tds = tr.find_all("td")
+            tds = tr.find_all("td", limit=2)  # 見出しと値の2セルだけ使う
             if len(tds) >= 2:
                 key = tds[0].get_text(strip=True)
                 val = tds[1].get_text(" ", strip=True)
@@ -2059,21 +2410,40 @@ def scrape_sogo_center_with_page(pw_page):
 # ─────────────────────────────────────────
 # ソースC: こども文化会館（requests）
 # ─────────────────────────────────────────
-def scrape_kodomobunka():
+EVENT_CGI_RE = re.compile(r"event\.cgi")
+YEAR_C_RE    = re.compile(r"(20\d{2})")
+MD_C_RE      = re.compile(r"(\d{1,2})月(\d{1,2})日")
+TIME_C_RE    = re.compile(r"(\d{1,2})\s*時(\d{2})分より[\s\S]{0,20}?(\d{1,2})時(\d{2})分まで")
+TARGET_C_RE  = re.compile(r"対象[/／]([^\s　参加費定員]+)")
+APPLY_C_RE   = re.compile(r"(事前申込|当日申込可)")
+
+
+def scrape_kodomobunka(html=None):
+    """html を渡した場合は取得を省略してそれを解析する（scrape() で先読みした本文）"""
     print("\n=== ソースC: こども文化会館 ===")
-    html = fetch_html(URL_C)
+    if html is None:
+        html = fetch_html(URL_C)
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     now = datetime.now()
 
     # event.cgiリンクを全取得
-    event_links = soup.find_all("a", href=re.compile(r"event\.cgi"))
+    event_links = soup.find_all("a", href=EVENT_CGI_RE)
     print(f"  event.cgiリンク数: {len(event_links)}")
 
     seen = set()
     events = []
 
+    # 同じ祖先を複数のリンクから辿るので、要素ごとのテキストは1回だけ作る
+    text_cache: dict[int, str] = {}
+
+    def text_of(tag):
+        t = text_cache.get(id(tag))
+        if t is None:
+            t = text_cache[id(tag)] = tag.get_text(" ", strip=True)
+        return t
+
     for a in event_links:
         title = a.get_text(strip=True)
         if not title or title in seen:
@@ -2088,18 +2458,18 @@ def scrape_kodomobunka():
             if container.parent is None:
                 break
             container = container.parent
-            ct = container.get_text(" ", strip=True)
-            if re.search(r"20\d{2}", ct) and re.search(r"\d{1,2}月\d{1,2}日", ct):
+            ct = text_of(container)
+            if YEAR_C_RE.search(ct) and MD_C_RE.search(ct):
                 break
 
-        ct = container.get_text(" ", strip=True) if container else ""
+        ct = text_of(container) if container else ""
 
         # 年
-        ym = re.search(r"(20\d{2})", ct)
+        ym = YEAR_C_RE.search(ct)
         year = ym.group(1) if ym else str(now.year)
 
         # 日付（期間の場合は開始日）
-        dm = re.search(r"(\d{1,2})月(\d{1,2})日", ct)
+        dm = MD_C_RE.search(ct)
         if not dm:
             continue
         mo, dy = dm.group(1).zfill(2), dm.group(2).zfill(2)
@@ -2107,9 +2477,7 @@ def scrape_kodomobunka():
         date_raw = f"{year}年{mo}月{dy}日"
 
         # 時間
-        time_m = re.search(
-            r"(\d{1,2})\s*時(\d{2})分より[\s\S]{0,20}?(\d{1,2})時(\d{2})分まで", ct
-        )
+        time_m = TIME_C_RE.search(ct)
         if time_m:
             time_raw = (f"{int(time_m.group(1)):02d}:{time_m.group(2)}"
                         f"〜{int(time_m.group(3)):02d}:{time_m.group(4)}")
@@ -2117,17 +2485,17 @@ def scrape_kodomobunka():
             time_raw = ""
 
         # 対象
-        tgt_m = re.search(r"対象[/／]([^\s　参加費定員]+)", ct)
+        tgt_m = TARGET_C_RE.search(ct)
         target_text = tgt_m.group(1) if tgt_m else ""
 
         # 申込
-        appl_m = re.search(r"(事前申込|当日申込可)", ct)
+        appl_m = APPLY_C_RE.search(ct)
         apply_text = appl_m.group(1) if appl_m else ""
         needs_res = "事前申込" in apply_text
 
         # 乳幼児・保護者向けフィルタ
         check = title + " " + target_text
-        if not any(kw in check for kw in KODOMOBUNKA_KW):
+        if not KODOMOBUNKA_RE.search(check):
             continue
 
         seen.add(title)
@@ -2154,14 +2522,42 @@ def scrape_kodomobunka():
 # ─────────────────────────────────────────
 # メイン処理
 # ─────────────────────────────────────────
+# 同じイベントが重複掲載されうるのは A・B・C の間だけ（子育てナビと総合センター等）。
+# 各児童館は別会場なので、同名・同日の定例行事（身体測定など）でも統合しない。
+DEDUPE_SOURCES = frozenset({"子育てナビ", SOURCE_B, SOURCE_C})
+
+
+def dedupe_events(events):
+    """
+    A・B・C のうち別ソースに同じイベント（★を除いたタイトルと日付が一致）があれば
+    先に取得した方だけ残す。同一ソース内の同名・同日（午前/午後の回など）と
+    児童館のイベントはそのまま残す。
+    """
+    first_source: dict[tuple[str, str], str] = {}
+    result = []
+    for ev in events:
+        if ev.get("date_iso") and ev.get("source") in DEDUPE_SOURCES:
+            key = (_normalize(ev["title"].lstrip("★")), ev["date_iso"])
+            if first_source.setdefault(key, ev["source"]) != ev["source"]:
+                continue
+        result.append(ev)
+    return result
+
+
 def scrape():
     all_events = []
 
-    # ソースA・Bは同一Playwrightブラウザで実行（起動コスト節約）
+    # ソースC は静的HTMLなので、A・B の描画待ちの間にスレッドで先に取得しておく
+    prefetch = ThreadPoolExecutor(max_workers=1)
+    html_c = prefetch.submit(fetch_html, URL_C)
+    prefetch.shutdown(wait=False)
+
+    # ソースA・B・Dは同一Playwrightブラウザ・同一ページで実行（起動コスト節約）
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         pw_page = browser.new_page()
         pw_page.set_extra_http_headers({"Accept-Language": "ja,en;q=0.9"})
+        block_heavy_resources(pw_page)
 
         try:
             all_events.extend(scrape_kosodate_with_page(pw_page))
@@ -2173,42 +2569,46 @@ def scrape():
         except Exception as e:
             print(f"ソースBエラー: {e}")
 
-        browser.close()
+        # ソースC はrequestsで取得（JSなし静的HTML）
+        try:
+            all_events.extend(scrape_kodomobunka(html_c.result()))
+        except Exception as e:
+            print(f"ソースCエラー: {e}")
 
-    # ソースC はrequestsで取得（JSなし静的HTML）
-    try:
-        all_events.extend(scrape_kodomobunka())
-    except Exception as e:
-        print(f"ソースCエラー: {e}")
+        # ソースD: 各児童館（PDF解析）- PDFリンク探索にPlaywrightページを共有
+        try:
+            all_events.extend(scrape_all_halls_adapted(pw_page=pw_page))
+        except Exception as e:
+            print(f"ソースDエラー: {e}")
 
-    # ソースD: 各児童館（PDF解析）- Playwrightページを共有して効率化
-    try:
-        with sync_playwright() as p2:
-            browser2 = p2.chromium.launch(headless=True)
-            pw_page2 = browser2.new_page()
-            pw_page2.set_extra_http_headers({"Accept-Language": "ja,en;q=0.9"})
-            all_events.extend(scrape_all_halls_adapted(pw_page=pw_page2))
-            browser2.close()
-    except Exception as e:
-        print(f"ソースDエラー: {e}")
+        browser.close()
 
-    # 日付順ソート
+    # ソース間の重複を除いてから日付順ソート
+    n_before = len(all_events)
+    all_events = dedupe_events(all_events)
+    if len(all_events) < n_before:
+        print(f"ソース間の重複 {n_before - len(all_events)} 件を除外")
     all_events.sort(key=lambda e: e.get("date_iso") or "9999")
     print(f"\n=== 全ソース合計: {len(all_events)} 件 ===")
     return all_events
 
 
-def save(events):
-    out_path = Path("docs/events.json")
-    out_path.parent.mkdir(exist_ok=True)
-    output = {
+def build_payload(events):
+    """events.json と index.html に埋め込む共通のデータ（updated_at も両方で揃える）"""
+    return {
         "updated_at": datetime.now().isoformat(),
         "count": len(events),
         "events": events,
     }
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
-    print(f"保存完了: {out_path} ({len(events)} 件)")
+
+
+def save(output):
+    out_path = Path("docs/events.json")
+    out_path.parent.mkdir(exist_ok=True)
+    # json.dump はチャンクごとに write するため、文字列にしてから1回で書き出す
+    # （差分を読みやすくするためこちらは整形して出力する）
+    out_path.write_text(json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"保存完了: {out_path} ({output['count']} 件)")
 
 
 def update_html(events_data):
@@ -2216,28 +2616,29 @@ def update_html(events_data):
     if not html_path.exists():
         print("警告: docs/index.html が見つかりません")
         return
-    with open(html_path, encoding="utf-8") as f:
-        html = f.read()
+    html = html_path.read_text(encoding="utf-8")
     start_marker = "/* EVENTS_DATA_START */"
     end_marker = "/* EVENTS_DATA_END */"
     s = html.find(start_marker)
-    e = html.find(end_marker)
+    e = html.find(end_marker, s + len(start_marker)) if s != -1 else -1
     if s == -1 or e == -1:
         print("警告: index.htmlのプレースホルダーが見つかりません")
         return
     json_str = json.dumps(events_data, ensure_ascii=False)
-    new_block = f"{start_marker}\nconst INLINE_EVENTS = {json_str};\n{end_marker}"
-    html = html[:s] + new_block + html[e + len(end_marker):]
+    # 前後の部分と埋め込みブロックを連結せず、そのまま順に書き出す
     with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html)
+        f.writelines((
+            html[:s],
+            f"{start_marker}\nconst INLINE_EVENTS = ",
+            json_str,
+            f";\n{end_marker}",
+            html[e + len(end_marker):],
+        ))
     print(f"index.html更新完了 ({events_data['count']}件埋め込み)")
 
 
 if __name__ == "__main__":
     events = scrape()
-    save(events)
-    update_html({
-        "updated_at": datetime.now().isoformat(),
-        "count": len(events),
-        "events": events,
-    })
+    payload = build_payload(events)
+    save(payload)
+    update_html(payload)